@@ -31,11 +31,19 @@ setup(
     packages=find_packages(where="src"),
     install_requires=[
         "loguru>=0.6.0",
-        "mcp>=1.0.0",
+        "mcp>=1.4.1,<1.5",
         "regex>=2022.10.31",
         "jinja2>=3.1.2",
         "markdown>=3.4.3",
     ],
+    extras_require={
+        # 可选加速依赖，缺失时自动回退到标准库实现
+        "fast": [
+            "orjson>=3.9",
+            "xxhash>=3",
+            "msgspec>=0.18",
+        ],
+    },
     entry_points={
         "console_scripts": [
             "codedoc_mcp=codedoc_mcp.__main__:main",
@@ -46,7 +54,6 @@ setup(
         "Intended Audience :: Developers",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Topic :: Software Development :: Documentation",
@@ -54,7 +61,7 @@ setup(
         "Topic :: Software Development :: Code Generators",
     ],
     keywords="code analysis, documentation, markdown, mermaid, diagram",
-    python_requires=">=3.8",
+    python_requires=">=3.9",
     project_urls={
         "Bug Reports": "https://github.com/aIFzzf/CodeDoc/issues",
         "Source": "https://github.com/aIFzzf/CodeDoc",
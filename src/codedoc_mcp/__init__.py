@@ -5,6 +5,7 @@ It exposes tools for code analysis, documentation generation, and visualization.
 """
 
 # Import built-in modules
+import importlib
 import os
 import sys
 
@@ -13,23 +14,39 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # Import local modules
 from __version__ import __version__
-from codedoc_mcp.app import mcp, APP_NAME
+from codedoc_mcp.app import APP_NAME
 from codedoc_mcp.errors import CodeDocError, ErrorCode
 
-# 导入解析器
-from codedoc_mcp.parser.base_parser import BaseParser
-from codedoc_mcp.parser.python_parser import PythonParser
-from codedoc_mcp.parser.csharp_parser import CSharpParser
-from codedoc_mcp.parser.cpp_parser import CppParser
-from codedoc_mcp.parser.javascript_parser import JavaScriptParser
-from codedoc_mcp.parser.shader_parser import ShaderParser
+# 延迟导入的公开API: 名称 -> (模块, 属性)
+_LAZY = {
+    # mcp从file模块获取, 以确保工具已注册
+    "mcp": ("codedoc_mcp.file", "mcp"),
+    # 解析器
+    "BaseParser": ("codedoc_mcp.parser.base_parser", "BaseParser"),
+    "PythonParser": ("codedoc_mcp.parser.python_parser", "PythonParser"),
+    "CSharpParser": ("codedoc_mcp.parser.csharp_parser", "CSharpParser"),
+    "CppParser": ("codedoc_mcp.parser.cpp_parser", "CppParser"),
+    "JavaScriptParser": ("codedoc_mcp.parser.javascript_parser", "JavaScriptParser"),
+    "ShaderParser": ("codedoc_mcp.parser.shader_parser", "ShaderParser"),
+    # 生成器
+    "MarkdownGenerator": ("codedoc_mcp.generator.markdown_generator", "MarkdownGenerator"),
+    "MermaidGenerator": ("codedoc_mcp.generator.mermaid_generator", "MermaidGenerator"),
+    # MCP工具
+    "analyze_code_file": ("codedoc_mcp.file", "analyze_code_file"),
+    "analyze_code_files": ("codedoc_mcp.file", "analyze_code_files"),
+    "analyze_directory": ("codedoc_mcp.file", "analyze_directory"),
+}
 
-# 导入生成器
-from codedoc_mcp.generator.markdown_generator import MarkdownGenerator
-from codedoc_mcp.generator.mermaid_generator import MermaidGenerator
 
-# 导入MCP工具
-from codedoc_mcp.file import analyze_code_file, analyze_directory
+def __getattr__(name):
+    """Import public API objects on first access (PEP 562)."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = _LAZY[name]
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
 
 # 暴露主要API
 __all__ = [
@@ -47,5 +64,6 @@ __all__ = [
     "MarkdownGenerator",
     "MermaidGenerator",
     "analyze_code_file",
+    "analyze_code_files",
     "analyze_directory"
 ]
@@ -5,12 +5,13 @@ from mcp.server.fastmcp import FastMCP
 
 # Import local modules
 from codedoc_mcp import __version__
+from codedoc_mcp.serialization import install_fast_json
 
 # Constants
 APP_NAME = "codedoc_mcp_server"
 APP_DESCRIPTION = "CodeDoc MCP Server for code analysis and enhancement."
 APP_DEPENDENCIES = [
-    "mcp>=1.3.0",
+    "mcp>=1.4.1,<1.5",
     "httpx>=0.28.1",
     "loguru>=0.7.2",
     "platformdirs>=4.2.0",
@@ -23,3 +24,6 @@ mcp = FastMCP(
     version=__version__,
     dependencies=APP_DEPENDENCIES,
 )
+
+# Serialize tool results with orjson when it is installed
+install_fast_json()
@@ -0,0 +1,418 @@
+"""Caching utilities for CodeDoc MCP Server.
+
+Parsed code data is persisted on disk keyed by a hash of the source file,
+the parser class, the parser code and the package version, so unchanged
+files are only parsed once across server runs. Per-file lookups are
+memoized in memory and revalidated against the file's modification time.
+
+Generated documentation is tracked by a small record next to the output
+files, so it is not regenerated while the source and options are unchanged.
+"""
+
+# Import built-in modules
+import atexit
+import functools
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+# Import third-party modules
+from loguru import logger
+from platformdirs import user_cache_dir
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# Import local modules
+from codedoc_mcp import __version__
+from codedoc_mcp.app import APP_NAME
+from codedoc_mcp.serialization import dumps
+
+# Constants
+AST_CACHE_DIR = Path(user_cache_dir(APP_NAME)) / "ast"
+# Directory inside each output directory recording which sources its files were generated from
+OUTPUT_CACHE_DIRNAME = ".codedoc-cache"
+# Parsed data is stored as MessagePack when msgspec is available, JSON otherwise
+AST_CACHE_SUFFIX = ".msgpack" if msgspec is not None else ".json"
+SOURCE_CACHE_SIZE = int(os.environ.get("CODEDOC_SOURCE_CACHE_SIZE", "128"))
+# Below this size a plain read is cheaper than setting up a memory map
+MMAP_THRESHOLD = 64 * 1024
+
+# Hit/miss counters, reported once at interpreter shutdown
+_stats = {"hits": 0, "misses": 0}
+_STATS_LOCK = threading.Lock()
+
+# Sources of the parsers and documentation generators, part of the cache keys
+_PARSER_DIR = Path(__file__).resolve().parent / "parser"
+_GENERATOR_DIR = Path(__file__).resolve().parent / "generator"
+
+
+class MTimeLRU:
+    """
+    Bounded LRU mapping of file paths to values, invalidated by mtime.
+    Safe to share between threads.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries to keep.
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[int, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path: Hashable, mtime_ns: int) -> Optional[Any]:
+        """
+        Get the value cached for a path.
+
+        Args:
+            path: Cache entry key, usually a file path.
+            mtime_ns: Current modification time of the file in nanoseconds.
+
+        Returns:
+            Optional[Any]: The cached value, or None if missing or stale.
+        """
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None or entry[0] != mtime_ns:
+                return None
+            self._entries.move_to_end(path)
+            return entry[1]
+
+    def put(self, path: Hashable, mtime_ns: int, value: Any) -> None:
+        """
+        Cache a value for a path, evicting the least recently used entry.
+
+        Args:
+            path: Cache entry key, usually a file path.
+            mtime_ns: Modification time of the file the value was derived from.
+            value: Value to cache.
+        """
+        with self._lock:
+            self._entries[path] = (mtime_ns, value)
+            self._entries.move_to_end(path)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+# Cache keys of recently seen source files
+_source_keys = MTimeLRU(SOURCE_CACHE_SIZE)
+
+if msgspec is not None:
+    _encode_parsed_data = msgspec.msgpack.Encoder().encode
+    _decode_parsed_data = msgspec.msgpack.Decoder(dict).decode
+else:
+    def _encode_parsed_data(data: Dict[str, Any]) -> bytes:
+        return dumps(data).encode("utf-8")
+
+    _decode_parsed_data = json.loads
+
+
+def _new_digest(data: Any = b"") -> Any:
+    """
+    Create a hash object for cache keys.
+
+    Cache keys need no collision resistance against an adversary, so the
+    much faster xxh128 is used when available, SHA256 otherwise.
+
+    Args:
+        data: Initial bytes-like data to hash.
+
+    Returns:
+        Any: Hash object with update() and hexdigest() methods.
+    """
+    if xxhash is not None:
+        return xxhash.xxh128(data)
+    return hashlib.sha256(data)
+
+
+def _hash_source(file_path: str) -> Any:
+    """
+    Hash the content of a source file.
+    
+    Large files are hashed straight from a read-only memory map instead of
+    being copied into a bytes object first.
+
+    Args:
+        file_path: Path to the source file.
+
+    Returns:
+        Any: Hash object fed with the file content.
+    """
+    with open(file_path, "rb") as file:
+        if os.fstat(file.fileno()).st_size < MMAP_THRESHOLD:
+            return _new_digest(file.read())
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return _new_digest(mapped)
+
+
+def get_cache_key(file_path: str, parser_name: str) -> str:
+    """
+    Compute the cache key for a source file.
+    
+    The source is only read and hashed again when its mtime has changed.
+
+    Args:
+        file_path: Path to the source file.
+        parser_name: Name of the parser class used for the file.
+
+    Returns:
+        str: Hex digest identifying the source content, parser code and version.
+    """
+    source_id = (os.path.abspath(file_path), parser_name)
+    mtime_ns = os.stat(file_path).st_mtime_ns
+    
+    key = _source_keys.get(source_id, mtime_ns)
+    if key is None:
+        digest = _hash_source(file_path)
+        digest.update(f"\0{parser_name}\0{__version__}\0{_code_fingerprint(_PARSER_DIR)}".encode("utf-8"))
+        key = digest.hexdigest()
+        _source_keys.put(source_id, mtime_ns, key)
+    
+    return key
+
+
+def _get_cache_path(key: str) -> Path:
+    """
+    Get the on-disk location of a cache entry.
+
+    Args:
+        key: Cache key returned by get_cache_key.
+
+    Returns:
+        Path: Path of the cache entry.
+    """
+    return AST_CACHE_DIR / key[:2] / f"{key[2:]}{AST_CACHE_SUFFIX}"
+
+
+def load_parsed_data(key: str) -> Optional[Dict[str, Any]]:
+    """
+    Load cached parsed data.
+
+    Args:
+        key: Cache key returned by get_cache_key.
+
+    Returns:
+        Optional[Dict[str, Any]]: The cached parsed data, or None on a miss.
+    """
+    try:
+        with open(_get_cache_path(key), "rb") as file:
+            data = _decode_parsed_data(file.read())
+    except FileNotFoundError:
+        _count("misses")
+        return None
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable cache entry {key}: {str(e)}")
+        _count("misses")
+        return None
+
+    _count("hits")
+    return data
+
+
+def _count(name: str) -> None:
+    """
+    Increment a cache statistics counter.
+
+    Lookups run on several executor threads, so updates are serialized.
+
+    Args:
+        name: Name of the counter.
+    """
+    with _STATS_LOCK:
+        _stats[name] += 1
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """
+    Write a file atomically.
+
+    The data is written to a temporary file first and moved into place,
+    so concurrent readers never see a partially written file.
+
+    Args:
+        path: Path of the file to write.
+        data: Content to write.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def store_parsed_data(key: str, data: Dict[str, Any]) -> None:
+    """
+    Store parsed data in the cache.
+
+    Args:
+        key: Cache key returned by get_cache_key.
+        data: Parsed data to store.
+    """
+    try:
+        _write_atomic(_get_cache_path(key), _encode_parsed_data(data))
+    except OSError as e:
+        logger.warning(f"Failed to write cache entry {key}: {str(e)}")
+
+
+@functools.lru_cache(maxsize=None)
+def _code_fingerprint(directory: Path) -> str:
+    """
+    Hash the source code of the modules in a package directory.
+
+    Computed once per process, so editing a parser or generator invalidates
+    the results cached by the previous code without a version bump.
+
+    Args:
+        directory: Directory of the package.
+
+    Returns:
+        str: Hex digest of the package's modules.
+    """
+    digest = _new_digest()
+    for path in sorted(directory.glob("*.py")):
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def get_output_cache_key(source_key: str, *options: Any) -> str:
+    """
+    Compute the key identifying a set of generated documentation files.
+
+    Args:
+        source_key: Cache key of the source file, from get_cache_key.
+        *options: Generation options the output depends on.
+
+    Returns:
+        str: Hex digest identifying the source, the generators and the options.
+    """
+    digest = _new_digest(source_key.encode("utf-8"))
+    digest.update(f"\0{_code_fingerprint(_GENERATOR_DIR)}".encode("utf-8"))
+    for option in options:
+        digest.update(f"\0{option}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _get_output_record_path(output_dir: str, file_path: str) -> Path:
+    """
+    Get the location of the record for files generated from a source.
+
+    Records are keyed on the full source path, so sources sharing a file
+    name in different directories do not replace each other's record.
+
+    Args:
+        output_dir: Directory the documentation files are written to.
+        file_path: Path to the source file.
+
+    Returns:
+        Path: Path of the JSON record.
+    """
+    source_id = _new_digest(os.path.abspath(file_path).encode("utf-8")).hexdigest()[:16]
+    return Path(output_dir) / OUTPUT_CACHE_DIRNAME / f"{Path(file_path).stem}-{source_id}.json"
+
+
+def _get_mtimes(generated_files: List[Dict[str, str]]) -> Optional[List[int]]:
+    """
+    Get the modification times of generated files.
+
+    Args:
+        generated_files: The type and path of each generated file.
+
+    Returns:
+        Optional[List[int]]: The mtime of each file in nanoseconds, or None
+            if one of them is missing.
+    """
+    try:
+        return [os.stat(generated_file["path"]).st_mtime_ns for generated_file in generated_files]
+    except OSError:
+        return None
+
+
+def load_generated_files(output_dir: str, file_path: str, key: str) -> Optional[List[Dict[str, str]]]:
+    """
+    Get previously generated documentation files that are still current.
+
+    Output files are named after the source file name only, so another
+    source with the same name may have overwritten them since. The record
+    therefore also stores the mtimes of the files it wrote, and any
+    change means they have to be generated again.
+
+    Args:
+        output_dir: Directory the documentation files are written to.
+        file_path: Path to the source file.
+        key: Key returned by get_output_cache_key.
+
+    Returns:
+        Optional[List[Dict[str, str]]]: The generated files, or None if
+            they have to be generated again.
+    """
+    try:
+        with open(_get_output_record_path(output_dir, file_path), "rb") as file:
+            record = json.load(file)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.debug(f"Ignoring unreadable output record for {file_path}: {str(e)}")
+        return None
+
+    if record.get("key") != key:
+        return None
+    generated_files = record.get("generated_files", [])
+    if _get_mtimes(generated_files) != record.get("mtimes"):
+        return None
+    return generated_files
+
+
+def store_generated_files(output_dir: str, file_path: str, key: str, generated_files: List[Dict[str, str]]) -> None:
+    """
+    Record the documentation files generated for a source.
+
+    Args:
+        output_dir: Directory the documentation files are written to.
+        file_path: Path to the source file.
+        key: Key returned by get_output_cache_key.
+        generated_files: The type and path of each generated file.
+    """
+    mtimes = _get_mtimes(generated_files)
+    if mtimes is None:
+        return
+    record = {"key": key, "generated_files": generated_files, "mtimes": mtimes}
+    try:
+        _write_atomic(_get_output_record_path(output_dir, file_path), dumps(record).encode("utf-8"))
+    except OSError as e:
+        logger.warning(f"Failed to write output record for {file_path}: {str(e)}")
+
+
+def _report_stats() -> None:
+    """Log cache hit/miss counts."""
+    with _STATS_LOCK:
+        hits, misses = _stats["hits"], _stats["misses"]
+    if hits or misses:
+        logger.info(f"AST cache: {hits} hits, {misses} misses")
+
+
+atexit.register(_report_stats)
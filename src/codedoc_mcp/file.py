@@ -7,9 +7,17 @@ This module provides functionality to process code files and generate documentat
 """
 
 # Import built-in modules
+import asyncio
+import collections
+import functools
+import importlib
+import multiprocessing
 import os
+import threading
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple, Type
 
 # Import third-party modules
 from loguru import logger
@@ -17,16 +25,121 @@ from mcp.server.fastmcp import Context
 
 # Import local modules
 from codedoc_mcp.app import mcp
+from codedoc_mcp.cache import MTimeLRU
+from codedoc_mcp.cache import get_cache_key
+from codedoc_mcp.cache import get_output_cache_key
+from codedoc_mcp.cache import load_generated_files
+from codedoc_mcp.cache import load_parsed_data
+from codedoc_mcp.cache import store_generated_files
+from codedoc_mcp.cache import store_parsed_data
 from codedoc_mcp.errors import ErrorCode
 from codedoc_mcp.errors import CodeDocError
 from codedoc_mcp.generator.markdown_generator import MarkdownGenerator
 from codedoc_mcp.generator.mermaid_generator import MermaidGenerator
 from codedoc_mcp.parser.base_parser import BaseParser
-from codedoc_mcp.parser.python_parser import PythonParser
-from codedoc_mcp.parser.csharp_parser import CSharpParser
-from codedoc_mcp.parser.cpp_parser import CppParser
-from codedoc_mcp.parser.javascript_parser import JavaScriptParser
-from codedoc_mcp.parser.shader_parser import ShaderParser
+from codedoc_mcp.serialization import dumps
+
+# Constants
+# Directories with fewer files are analyzed in-process, a pool costs more than it saves
+PARALLEL_MIN_FILES = 4
+# Number of per-file results sent in each streamed notification
+STREAM_CHUNK_SIZE = 16
+# Per-file messages are sent at debug level, with a summary every this many files
+PROGRESS_LOG_INTERVAL = 100
+# Worker processes start fresh instead of forking the threaded server process
+_POOL_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+# Parser module and class for each supported file extension, imported on first use
+_EXT_PARSERS: Dict[str, Tuple[str, str]] = {
+    '.py': ('codedoc_mcp.parser.python_parser', 'PythonParser'),
+    '.cs': ('codedoc_mcp.parser.csharp_parser', 'CSharpParser'),
+    '.cpp': ('codedoc_mcp.parser.cpp_parser', 'CppParser'),
+    '.h': ('codedoc_mcp.parser.cpp_parser', 'CppParser'),
+    '.hpp': ('codedoc_mcp.parser.cpp_parser', 'CppParser'),
+    '.cc': ('codedoc_mcp.parser.cpp_parser', 'CppParser'),
+    '.js': ('codedoc_mcp.parser.javascript_parser', 'JavaScriptParser'),
+    '.jsx': ('codedoc_mcp.parser.javascript_parser', 'JavaScriptParser'),
+    '.ts': ('codedoc_mcp.parser.javascript_parser', 'JavaScriptParser'),
+    '.tsx': ('codedoc_mcp.parser.javascript_parser', 'JavaScriptParser'),
+    '.shader': ('codedoc_mcp.parser.shader_parser', 'ShaderParser'),
+    '.compute': ('codedoc_mcp.parser.shader_parser', 'ShaderParser'),
+    '.cginc': ('codedoc_mcp.parser.shader_parser', 'ShaderParser'),
+    '.hlsl': ('codedoc_mcp.parser.shader_parser', 'ShaderParser'),
+}
+
+# Number of parse results kept in memory for files analyzed again shortly after
+RECENT_PARSES_SIZE = int(os.environ.get("CODEDOC_RECENT_PARSES_SIZE", "64"))
+
+# Files larger than this many bytes are skipped by directory scans, 0 disables the limit
+MAX_FILE_BYTES = int(os.environ.get("CODEDOC_MAX_FILE_BYTES", str(10 * 1024 * 1024)))
+
+# Output directories already created by this process
+_ENSURED_DIRS: Set[str] = set()
+
+# Parsed data of recently analyzed files, in front of the on-disk cache
+_recent_parses = MTimeLRU(RECENT_PARSES_SIZE)
+
+# One reusable parser instance per parser class and thread
+_parser_instances = threading.local()
+
+# Parses in progress, so concurrent requests for the same file share one parse
+_INFLIGHT: Dict[Tuple[Tuple[str, str], int], Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+
+def _get_parser_spec(file_path: str) -> Tuple[str, str]:
+    """
+    Get the module and class name of the parser for a file.
+
+    Args:
+        file_path: Path to the code file.
+
+    Returns:
+        Tuple[str, str]: The parser module name and class name.
+
+    Raises:
+        CodeDocError: If the file type is not supported.
+    """
+    file_ext = Path(file_path).suffix.lower()
+    parser_spec = _EXT_PARSERS.get(file_ext)
+    
+    if parser_spec is None:
+        raise CodeDocError(f"Unsupported file type: {file_ext}", ErrorCode.VALIDATION_ERROR)
+    
+    return parser_spec
+
+
+@functools.lru_cache(maxsize=None)
+def _import_parser_class(module_name: str, class_name: str) -> Type[BaseParser]:
+    """
+    Import a parser class.
+
+    Args:
+        module_name: Name of the module defining the parser.
+        class_name: Name of the parser class.
+
+    Returns:
+        Type[BaseParser]: The parser class.
+    """
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def get_parser_class_for_file(file_path: str) -> Type[BaseParser]:
+    """
+    Get the appropriate parser class for a given file based on its extension.
+
+    Args:
+        file_path: Path to the code file.
+
+    Returns:
+        Type[BaseParser]: The parser class handling the file type.
+
+    Raises:
+        CodeDocError: If the file type is not supported.
+    """
+    return _import_parser_class(*_get_parser_spec(file_path))
 
 
 def get_parser_for_file(file_path: str) -> BaseParser:
@@ -42,20 +155,254 @@ def get_parser_for_file(file_path: str) -> BaseParser:
     Raises:
         CodeDocError: If the file type is not supported.
     """
-    file_ext = Path(file_path).suffix.lower()
+    return get_parser_class_for_file(file_path)(file_path)
+
+
+def _get_parser(module_name: str, class_name: str, file_path: str) -> BaseParser:
+    """
+    Get this thread's parser instance of a class, reset to a file.
+
+    Args:
+        module_name: Name of the module defining the parser.
+        class_name: Name of the parser class.
+        file_path: Path to the code file.
+
+    Returns:
+        BaseParser: The parser, ready to parse the file.
+    """
+    parsers = getattr(_parser_instances, "parsers", None)
+    if parsers is None:
+        parsers = _parser_instances.parsers = {}
     
-    if file_ext == '.py':
-        return PythonParser(file_path)
-    elif file_ext == '.cs':
-        return CSharpParser(file_path)
-    elif file_ext in ['.cpp', '.h', '.hpp', '.cc']:
-        return CppParser(file_path)
-    elif file_ext in ['.js', '.jsx', '.ts', '.tsx']:
-        return JavaScriptParser(file_path)
-    elif file_ext in ['.shader', '.compute', '.cginc', '.hlsl']:
-        return ShaderParser(file_path)
+    parser = parsers.get(class_name)
+    if parser is None:
+        parser = parsers[class_name] = _import_parser_class(module_name, class_name)(file_path)
     else:
-        raise CodeDocError(f"Unsupported file type: {file_ext}", ErrorCode.VALIDATION_ERROR)
+        parser.reset(file_path)
+    return parser
+
+
+def parse_file(file_path: str) -> Dict[str, Any]:
+    """
+    Parse a code file, reusing cached results for unchanged sources.
+    
+    Recent results are kept in memory, so analyzing a file again right
+    after it was parsed skips hashing and reading the on-disk cache.
+    Concurrent calls for the same unchanged file share a single parse.
+
+    Args:
+        file_path: Path to the code file.
+
+    Returns:
+        Dict[str, Any]: Structured information about the code.
+
+    Raises:
+        CodeDocError: If the file type is not supported.
+    """
+    module_name, class_name = _get_parser_spec(file_path)
+    source_id = (os.path.abspath(file_path), class_name)
+    mtime_ns = os.stat(file_path).st_mtime_ns
+    
+    parsed_data = _recent_parses.get(source_id, mtime_ns)
+    if parsed_data is not None:
+        return parsed_data
+    
+    # Wait for an identical parse already running in another thread
+    flight_key = (source_id, mtime_ns)
+    with _INFLIGHT_LOCK:
+        flight = _INFLIGHT.get(flight_key)
+        is_leader = flight is None
+        if is_leader:
+            flight = _INFLIGHT[flight_key] = Future()
+    if not is_leader:
+        return flight.result()
+    
+    try:
+        # The parser module is only imported when the file actually has to be parsed
+        cache_key = get_cache_key(file_path, class_name)
+        parsed_data = load_parsed_data(cache_key)
+        if parsed_data is None:
+            parsed_data = _get_parser(module_name, class_name, file_path).parse()
+            store_parsed_data(cache_key, parsed_data)
+        
+        _recent_parses.put(source_id, mtime_ns, parsed_data)
+        flight.set_result(parsed_data)
+    except BaseException as e:
+        flight.set_exception(e)
+        raise
+    finally:
+        with _INFLIGHT_LOCK:
+            _INFLIGHT.pop(flight_key, None)
+    
+    return parsed_data
+
+
+@functools.lru_cache(maxsize=None)
+def _get_generators(output_dir: str) -> Tuple[MarkdownGenerator, MermaidGenerator]:
+    """
+    Get the documentation generators for an output directory.
+
+    The generators are stateless, so one pair is shared by every file
+    written to the same directory.
+
+    Args:
+        output_dir: Directory to save generated documentation files.
+
+    Returns:
+        Tuple[MarkdownGenerator, MermaidGenerator]: The Markdown and Mermaid generators.
+    """
+    _ensure_output_dir(output_dir)
+    return MarkdownGenerator(output_dir), MermaidGenerator(output_dir)
+
+
+def _ensure_output_dir(output_dir: str) -> None:
+    """
+    Create an output directory once per process.
+
+    Args:
+        output_dir: Directory to create.
+    """
+    if output_dir in _ENSURED_DIRS:
+        return
+    os.makedirs(output_dir, exist_ok=True)
+    _ENSURED_DIRS.add(output_dir)
+
+
+def generate_documentation(
+    parsed_data: Dict[str, Any],
+    file_path: str,
+    output_dir: str = "docs",
+    generate_markdown: bool = True,
+    generate_class_diagram: bool = True,
+    generate_flow_diagram: bool = False,
+    generate_structure_diagram: bool = False,
+    output_name: Optional[str] = None
+) -> List[Dict[str, str]]:
+    """
+    Generate documentation files from parsed code data.
+    
+    Generation is skipped when the files were already produced from the
+    same source with the same options and still exist.
+
+    Args:
+        parsed_data: Parsed data of the code file.
+        file_path: Path to the code file the data was parsed from.
+        output_dir: Directory to save generated documentation files.
+        generate_markdown: Whether to generate Markdown documentation.
+        generate_class_diagram: Whether to generate a Mermaid class diagram.
+        generate_flow_diagram: Whether to generate a Mermaid flow diagram.
+        generate_structure_diagram: Whether to generate a Mermaid structure diagram.
+        output_name: Base name of the generated files, defaults to the file name without extension.
+
+    Returns:
+        List[Dict[str, str]]: The type and path of each generated file.
+    """
+    # Create file name base
+    file_name_base = output_name or os.path.splitext(os.path.basename(file_path))[0]
+    
+    # Skip generation if the files from an identical run are still in place
+    output_key = get_output_cache_key(
+        get_cache_key(file_path, _get_parser_spec(file_path)[1]),
+        output_dir,
+        generate_markdown,
+        generate_class_diagram,
+        generate_flow_diagram,
+        generate_structure_diagram,
+        file_name_base
+    )
+    generated_files = load_generated_files(output_dir, file_path, output_key)
+    if generated_files is not None:
+        return generated_files
+    
+    generated_files = []
+    
+    # Shared generators, their output directory is created up front since files may be generated concurrently
+    markdown_generator, mermaid_generator = _get_generators(output_dir)
+    
+    # Generate Markdown documentation
+    if generate_markdown:
+        markdown_file = f"{file_name_base}_documentation.md"
+        markdown_path = markdown_generator.generate(parsed_data, markdown_file)
+        generated_files.append({
+            "type": "markdown",
+            "path": markdown_path
+        })
+    
+    # Generate Mermaid diagrams
+    if generate_class_diagram:
+        class_diagram_file = f"{file_name_base}_class_diagram.md"
+        class_diagram_path = mermaid_generator.generate_class_diagram(parsed_data, class_diagram_file)
+        generated_files.append({
+            "type": "class_diagram",
+            "path": class_diagram_path
+        })
+    
+    if generate_flow_diagram:
+        flow_diagram_file = f"{file_name_base}_flow_diagram.md"
+        flow_diagram_path = mermaid_generator.generate_flow_diagram(parsed_data, flow_diagram_file)
+        generated_files.append({
+            "type": "flow_diagram",
+            "path": flow_diagram_path
+        })
+    
+    if generate_structure_diagram:
+        structure_diagram_file = f"{file_name_base}_structure_diagram.md"
+        structure_diagram_path = mermaid_generator.generate_structure_diagram(parsed_data, structure_diagram_file)
+        generated_files.append({
+            "type": "structure_diagram",
+            "path": structure_diagram_path
+        })
+    
+    store_generated_files(output_dir, file_path, output_key, generated_files)
+    return generated_files
+
+
+def analyze_file(
+    file_path: str,
+    output_dir: str = "docs",
+    generate_markdown: bool = True,
+    generate_class_diagram: bool = True,
+    generate_flow_diagram: bool = False,
+    generate_structure_diagram: bool = False,
+    output_name: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Analyze a code file and generate documentation synchronously.
+
+    Args:
+        file_path: Path to the code file to analyze.
+        output_dir: Directory to save generated documentation files.
+        generate_markdown: Whether to generate Markdown documentation.
+        generate_class_diagram: Whether to generate a Mermaid class diagram.
+        generate_flow_diagram: Whether to generate a Mermaid flow diagram.
+        generate_structure_diagram: Whether to generate a Mermaid structure diagram.
+        output_name: Base name of the generated files, defaults to the file name without extension.
+
+    Returns:
+        Dict[str, Any]: A dictionary containing paths to generated files and parsed data.
+
+    Raises:
+        CodeDocError: If the file cannot be processed.
+    """
+    if not os.path.exists(file_path):
+        raise CodeDocError(f"File not found: {file_path}", ErrorCode.FILE_NOT_FOUND)
+    
+    parsed_data = parse_file(file_path)
+    
+    return {
+        "file_path": file_path,
+        "parsed_data": parsed_data,
+        "generated_files": generate_documentation(
+            parsed_data,
+            file_path,
+            output_dir=output_dir,
+            generate_markdown=generate_markdown,
+            generate_class_diagram=generate_class_diagram,
+            generate_flow_diagram=generate_flow_diagram,
+            generate_structure_diagram=generate_structure_diagram,
+            output_name=output_name
+        )
+    }
 
 
 @mcp.tool()
@@ -99,15 +446,15 @@ async def analyze_code_file(
                 await ctx.error(error_msg)
             raise CodeDocError(error_msg, ErrorCode.FILE_NOT_FOUND)
         
-        # Get appropriate parser
-        parser = get_parser_for_file(file_path)
-        
         if ctx:
             await ctx.report_progress(0.3)
             await ctx.info("Parsing file...")
         
-        # Parse the file
-        parsed_data = parser.parse()
+        # Parse and generate in a worker thread so file I/O does not block the event loop
+        loop = asyncio.get_running_loop()
+        
+        # Parse the file, skipping the parser for unchanged sources
+        parsed_data = await loop.run_in_executor(None, parse_file, file_path)
         
         if ctx:
             await ctx.report_progress(0.5)
@@ -117,62 +464,21 @@ async def analyze_code_file(
         result = {
             "file_path": file_path,
             "parsed_data": parsed_data,
-            "generated_files": []
+            "generated_files": await loop.run_in_executor(None, functools.partial(
+                generate_documentation,
+                parsed_data,
+                file_path,
+                output_dir=output_dir,
+                generate_markdown=generate_markdown,
+                generate_class_diagram=generate_class_diagram,
+                generate_flow_diagram=generate_flow_diagram,
+                generate_structure_diagram=generate_structure_diagram
+            ))
         }
         
-        # Create file name base
-        file_name_base = os.path.splitext(os.path.basename(file_path))[0]
-        
-        # Generate Markdown documentation
-        if generate_markdown:
-            markdown_generator = MarkdownGenerator(output_dir)
-            markdown_file = f"{file_name_base}_documentation.md"
-            markdown_path = markdown_generator.generate(parsed_data, markdown_file)
-            result["generated_files"].append({
-                "type": "markdown",
-                "path": markdown_path
-            })
-            
-            if ctx:
-                await ctx.info(f"Generated Markdown documentation: {markdown_path}")
-        
-        # Generate Mermaid diagrams
-        mermaid_generator = MermaidGenerator(output_dir)
-        
-        if generate_class_diagram:
-            class_diagram_file = f"{file_name_base}_class_diagram.md"
-            class_diagram_path = mermaid_generator.generate_class_diagram(parsed_data, class_diagram_file)
-            result["generated_files"].append({
-                "type": "class_diagram",
-                "path": class_diagram_path
-            })
-            
-            if ctx:
-                await ctx.info(f"Generated class diagram: {class_diagram_path}")
-        
-        if generate_flow_diagram:
-            flow_diagram_file = f"{file_name_base}_flow_diagram.md"
-            flow_diagram_path = mermaid_generator.generate_flow_diagram(parsed_data, flow_diagram_file)
-            result["generated_files"].append({
-                "type": "flow_diagram",
-                "path": flow_diagram_path
-            })
-            
-            if ctx:
-                await ctx.info(f"Generated flow diagram: {flow_diagram_path}")
-        
-        if generate_structure_diagram:
-            structure_diagram_file = f"{file_name_base}_structure_diagram.md"
-            structure_diagram_path = mermaid_generator.generate_structure_diagram(parsed_data, structure_diagram_file)
-            result["generated_files"].append({
-                "type": "structure_diagram",
-                "path": structure_diagram_path
-            })
-            
-            if ctx:
-                await ctx.info(f"Generated structure diagram: {structure_diagram_path}")
-        
         if ctx:
+            for generated_file in result["generated_files"]:
+                await ctx.info(f"Generated {generated_file['type']}: {generated_file['path']}")
             await ctx.report_progress(1.0)
             await ctx.info("Analysis complete!")
         
@@ -188,6 +494,145 @@ async def analyze_code_file(
         raise CodeDocError(error_msg, ErrorCode.UNKNOWN_ERROR) from e
 
 
+def _iter_code_files(
+    directory_path: str,
+    file_extensions: Tuple[str, ...],
+    recursive: bool = True,
+    skipped: Optional[List[str]] = None
+):
+    """
+    Yield code files in a directory, files before subdirectories.
+
+    Uses os.scandir so file type checks are answered from the directory
+    listing instead of a separate stat call per entry. Directories are
+    walked depth-first from an explicit stack rather than by recursion,
+    so deep trees neither chain nested generators nor hit the recursion
+    limit.
+    
+    Files larger than MAX_FILE_BYTES, typically generated sources, are
+    skipped before any parser reads them and collected in skipped. Like
+    os.walk, directories and entries that cannot be read are skipped
+    instead of ending the scan.
+
+    Args:
+        directory_path: Path to the directory to scan.
+        file_extensions: Lowercase file extensions to include.
+        recursive: Whether to descend into subdirectories.
+        skipped: List receiving the paths of files skipped for their size.
+
+    Yields:
+        str: Path of each matching file.
+    """
+    pending = [directory_path]
+    while pending:
+        directory = pending.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError as e:
+            logger.debug(f"Skipping unreadable directory {directory}: {str(e)}")
+            continue
+        
+        subdirectories = []
+        with entries:
+            for entry in entries:
+                try:
+                    is_code_file = entry.name.lower().endswith(file_extensions) and entry.is_file()
+                    if not is_code_file and recursive and entry.is_dir(follow_symlinks=False):
+                        subdirectories.append(entry.path)
+                except OSError as e:
+                    logger.debug(f"Skipping unreadable entry {entry.path}: {str(e)}")
+                    continue
+                
+                if is_code_file:
+                    if MAX_FILE_BYTES:
+                        try:
+                            size = entry.stat().st_size
+                        except OSError as e:
+                            logger.debug(f"Skipping unreadable file {entry.path}: {str(e)}")
+                            continue
+                        if size > MAX_FILE_BYTES:
+                            logger.info(f"Skipping file larger than {MAX_FILE_BYTES} bytes: {entry.path}")
+                            if skipped is not None:
+                                skipped.append(entry.path)
+                            continue
+                    yield entry.path
+        
+        # Pushed in reverse so the first subdirectory is walked next
+        subdirectories.reverse()
+        pending.extend(subdirectories)
+
+
+def _get_output_names(directory_path: str, file_paths: List[str]) -> Dict[str, str]:
+    """
+    Get distinct output names for files whose names would collide.
+
+    Files are documented under their name without extension, so sources
+    such as several __init__.py files would write the same output files.
+    Those are named after their path relative to the directory instead.
+
+    Args:
+        directory_path: Directory the files were found in.
+        file_paths: Paths of the files to analyze.
+
+    Returns:
+        Dict[str, str]: Output names of the colliding files, by file path.
+    """
+    stems = collections.Counter(
+        os.path.splitext(os.path.basename(file_path))[0] for file_path in file_paths
+    )
+    
+    return {
+        file_path: os.path.relpath(file_path, directory_path).replace(os.sep, ".")
+        for file_path in file_paths
+        if stems[os.path.splitext(os.path.basename(file_path))[0]] > 1
+    }
+
+
+def _analyze_directory_file(
+    file_path: str,
+    output_name: Optional[str],
+    output_dir: str,
+    generate_markdown: bool,
+    generate_class_diagram: bool
+) -> Dict[str, Any]:
+    """
+    Analyze one file of a directory run.
+
+    Defined at module level so it can be sent to worker processes.
+
+    Args:
+        file_path: Path to the code file to analyze.
+        output_name: Base name of the generated files, or None for the file name without extension.
+        output_dir: Directory to save generated documentation files.
+        generate_markdown: Whether to generate Markdown documentation.
+        generate_class_diagram: Whether to generate a Mermaid class diagram.
+
+    Returns:
+        Dict[str, Any]: The file's status, and its generated files or error message.
+    """
+    try:
+        result = analyze_file(
+            file_path,
+            output_dir=output_dir,
+            generate_markdown=generate_markdown,
+            generate_class_diagram=generate_class_diagram,
+            output_name=output_name
+        )
+    except Exception as e:
+        logger.error(f"Error analyzing file {file_path}: {str(e)}")
+        return {
+            "file_path": file_path,
+            "status": "error",
+            "error": str(e)
+        }
+    
+    return {
+        "file_path": file_path,
+        "status": "success",
+        "generated_files": result["generated_files"]
+    }
+
+
 @mcp.tool()
 async def analyze_directory(
     directory_path: str,
@@ -196,11 +641,18 @@ async def analyze_directory(
     recursive: bool = True,
     generate_markdown: bool = True,
     generate_class_diagram: bool = True,
+    stream_results: bool = False,
+    max_workers: Optional[int] = None,
     ctx: Optional[Context] = None
 ) -> Dict[str, Any]:
     """
     Analyze all code files in a directory and generate documentation.
 
+    With stream_results, per-file results are sent to the client as
+    notifications in chunks of STREAM_CHUNK_SIZE while files complete,
+    and only a summary is returned. Files larger than MAX_FILE_BYTES are
+    not analyzed and are listed in skipped_files.
+
     Args:
         directory_path: Path to the directory containing code files.
         output_dir: Directory to save generated documentation files.
@@ -208,6 +660,9 @@ async def analyze_directory(
         recursive: Whether to search subdirectories recursively.
         generate_markdown: Whether to generate Markdown documentation.
         generate_class_diagram: Whether to generate Mermaid class diagrams.
+        stream_results: Whether to stream per-file results instead of returning them.
+        max_workers: Maximum number of worker processes, defaults to the CPU count.
+            With 1, files are analyzed in-process without a pool.
         ctx: FastMCP context.
 
     Returns:
@@ -234,17 +689,12 @@ async def analyze_directory(
             file_extensions = ['.py', '.cs', '.cpp', '.h', '.hpp', '.js', '.jsx', '.ts', '.tsx', '.shader']
         
         # Find all matching files
-        files_to_analyze = []
-        if recursive:
-            for root, _, files in os.walk(directory_path):
-                for file in files:
-                    if any(file.endswith(ext) for ext in file_extensions):
-                        files_to_analyze.append(os.path.join(root, file))
-        else:
-            for file in os.listdir(directory_path):
-                file_path = os.path.join(directory_path, file)
-                if os.path.isfile(file_path) and any(file.endswith(ext) for ext in file_extensions):
-                    files_to_analyze.append(file_path)
+        extensions = tuple(ext.lower() for ext in file_extensions)
+        skipped_files = []
+        files_to_analyze = list(_iter_code_files(directory_path, extensions, recursive, skipped_files))
+        
+        if skipped_files and ctx:
+            await ctx.info(f"Skipped {len(skipped_files)} files larger than {MAX_FILE_BYTES} bytes")
         
         if not files_to_analyze:
             if ctx:
@@ -252,44 +702,91 @@ async def analyze_directory(
             return {
                 "directory_path": directory_path,
                 "analyzed_files": [],
-                "generated_files": []
+                "generated_files": [],
+                "skipped_files": skipped_files
             }
         
-        # Analyze each file
-        analyzed_files = []
-        generated_files = []
+        # Analyze each file, in worker processes unless there are only a few
         total_files = len(files_to_analyze)
+        output_names = _get_output_names(directory_path, files_to_analyze)
+        analyze_one = functools.partial(
+            _analyze_directory_file,
+            output_dir=output_dir,
+            generate_markdown=generate_markdown,
+            generate_class_diagram=generate_class_diagram
+        )
+        loop = asyncio.get_running_loop()
+        stream = stream_results and ctx is not None
         
-        for i, file_path in enumerate(files_to_analyze):
-            if ctx:
-                progress = 0.1 + 0.9 * (i / total_files)
-                await ctx.report_progress(progress)
-                await ctx.info(f"Analyzing file {i+1}/{total_files}: {file_path}")
-            
-            try:
-                result = await analyze_code_file(
-                    file_path=file_path,
-                    output_dir=output_dir,
-                    generate_markdown=generate_markdown,
-                    generate_class_diagram=generate_class_diagram,
-                    generate_flow_diagram=False,
-                    generate_structure_diagram=False
-                )
-                
-                analyzed_files.append({
-                    "file_path": file_path,
-                    "status": "success"
-                })
+        worker_count = min(max_workers or os.cpu_count() or 1, total_files)
+        executor = None
+        if total_files >= PARALLEL_MIN_FILES and worker_count > 1:
+            executor = ProcessPoolExecutor(max_workers=worker_count, mp_context=_POOL_CONTEXT)
+        
+        async def completed_outcomes():
+            if executor is None:
+                for file_path in files_to_analyze:
+                    yield await loop.run_in_executor(
+                        None, analyze_one, file_path, output_names.get(file_path)
+                    )
+            else:
+                futures = [
+                    loop.run_in_executor(executor, analyze_one, file_path, output_names.get(file_path))
+                    for file_path in files_to_analyze
+                ]
+                for future in asyncio.as_completed(futures):
+                    yield await future
+        
+        outcomes = {}
+        chunk = []
+        failed = 0
+        i = 0
+        
+        try:
+            async for outcome in completed_outcomes():
+                i += 1
+                if ctx:
+                    progress = 0.1 + 0.9 * (i / total_files)
+                    await ctx.report_progress(progress)
+                    await ctx.debug(f"Analyzed file {i}/{total_files}: {outcome['file_path']}")
+                    if i % PROGRESS_LOG_INTERVAL == 0:
+                        await ctx.info(f"Analyzed {i}/{total_files} files")
                 
-                generated_files.extend(result["generated_files"])
+                if not stream:
+                    outcomes[outcome["file_path"]] = outcome
+                    continue
                 
-            except Exception as e:
-                logger.error(f"Error analyzing file {file_path}: {str(e)}")
-                analyzed_files.append({
-                    "file_path": file_path,
-                    "status": "error",
-                    "error": str(e)
-                })
+                if outcome["status"] != "success":
+                    failed += 1
+                chunk.append(outcome)
+                if len(chunk) >= STREAM_CHUNK_SIZE:
+                    await ctx.info(dumps({"results": chunk}))
+                    chunk = []
+        finally:
+            # Never block the event loop waiting for workers, e.g. when the request is cancelled
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+        
+        if stream:
+            if chunk:
+                await ctx.info(dumps({"results": chunk}))
+            await ctx.report_progress(1.0)
+            await ctx.info(f"Analysis complete! Analyzed {total_files} files.")
+            return {
+                "directory_path": directory_path,
+                "total_files": total_files,
+                "failed_files": failed,
+                "skipped_files": skipped_files
+            }
+        
+        # Collect results in directory order
+        analyzed_files = []
+        generated_files = []
+        
+        for file_path in files_to_analyze:
+            outcome = outcomes[file_path]
+            generated_files.extend(outcome.pop("generated_files", []))
+            analyzed_files.append(outcome)
         
         if ctx:
             await ctx.report_progress(1.0)
@@ -298,7 +795,8 @@ async def analyze_directory(
         return {
             "directory_path": directory_path,
             "analyzed_files": analyzed_files,
-            "generated_files": generated_files
+            "generated_files": generated_files,
+            "skipped_files": skipped_files
         }
         
     except Exception as e:
@@ -309,3 +807,68 @@ async def analyze_directory(
         if isinstance(e, CodeDocError):
             raise
         raise CodeDocError(error_msg, ErrorCode.UNKNOWN_ERROR) from e
+
+
+@mcp.tool()
+async def analyze_code_files(
+    file_paths: List[str],
+    output_dir: str = "docs",
+    generate_markdown: bool = True,
+    generate_class_diagram: bool = True,
+    max_concurrent: int = 8,
+    ctx: Optional[Context] = None
+) -> Dict[str, Any]:
+    """
+    Analyze several code files in a single call and generate documentation.
+
+    Files are processed concurrently in worker threads. A file that fails
+    does not stop the others; its error is reported instead.
+
+    Args:
+        file_paths: Paths to the code files to analyze.
+        output_dir: Directory to save generated documentation files.
+        generate_markdown: Whether to generate Markdown documentation.
+        generate_class_diagram: Whether to generate Mermaid class diagrams.
+        max_concurrent: Maximum number of files processed at the same time.
+        ctx: FastMCP context.
+
+    Returns:
+        Dict[str, Any]: Per-file results and per-file error messages.
+    """
+    if ctx:
+        await ctx.info(f"Analyzing {len(file_paths)} files")
+    
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(max(1, max_concurrent))
+    
+    async def analyze(file_path: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await loop.run_in_executor(None, functools.partial(
+                analyze_file,
+                file_path,
+                output_dir=output_dir,
+                generate_markdown=generate_markdown,
+                generate_class_diagram=generate_class_diagram
+            ))
+    
+    outcomes = await asyncio.gather(
+        *(analyze(file_path) for file_path in file_paths),
+        return_exceptions=True
+    )
+    
+    results = {}
+    errors = {}
+    for file_path, outcome in zip(file_paths, outcomes):
+        if isinstance(outcome, Exception):
+            logger.error(f"Error analyzing file {file_path}: {str(outcome)}")
+            errors[file_path] = str(outcome)
+        else:
+            results[file_path] = outcome
+    
+    if ctx:
+        await ctx.info(f"Analysis complete! {len(results)} succeeded, {len(errors)} failed.")
+    
+    return {
+        "results": results,
+        "errors": errors
+    }
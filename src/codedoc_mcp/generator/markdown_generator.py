@@ -6,15 +6,52 @@ Markdown generator module.
 This module provides functionality to generate Markdown documentation from parsed code data.
 """
 
+import io
 import os
 from typing import Dict, List, Any, Optional
 
+from .writer import write_file
+
+# Keys of parsed data not rendered as generic sections
+_SKIP_SECTION_KEYS = frozenset(("language", "file_path", "error"))
+
+# Line templates filled straight from member dicts with format_map
+_PROP_LINE = "- `{name}`: {type}\n\n"
+_SHADER_PROP_LINE = "- `{name}`: {type} - {display_name}\n"
+
+
+def _base_name(file_path: str) -> str:
+    """
+    Get the final component of a path.
+
+    Same result as os.path.basename for the paths parsers produce, with a
+    single right-hand search instead of the generic path handling.
+
+    Args:
+        file_path: Path to split.
+
+    Returns:
+        str: The part of the path after the last separator.
+    """
+    if os.altsep and os.altsep in file_path:
+        file_path = file_path.replace(os.altsep, os.sep)
+    return file_path.rpartition(os.sep)[2]
+
 
 class MarkdownGenerator:
     """
     Generates Markdown documentation from parsed code data.
     """
 
+    # Generator method for each language, anything else uses the generic one
+    _LANG_DISPATCH = {
+        "C#": "_generate_csharp_markdown",
+        "Shader": "_generate_shader_markdown",
+        "Python": "_generate_python_markdown",
+        "JavaScript": "_generate_javascript_markdown",
+        "C++": "_generate_cpp_markdown",
+    }
+
     def __init__(self, output_dir: str = "docs"):
         """
         Initialize the Markdown generator.
@@ -25,8 +62,7 @@ class MarkdownGenerator:
         self.output_dir = output_dir
         
         # Create output directory if it doesn't exist
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+        os.makedirs(output_dir, exist_ok=True)
 
     def generate(self, parsed_data: Dict[str, Any], output_file: str) -> str:
         """
@@ -41,23 +77,12 @@ class MarkdownGenerator:
         """
         language = parsed_data.get("language", "Unknown")
         
-        if language == "C#":
-            content = self._generate_csharp_markdown(parsed_data)
-        elif language == "Shader":
-            content = self._generate_shader_markdown(parsed_data)
-        elif language == "Python":
-            content = self._generate_python_markdown(parsed_data)
-        elif language == "JavaScript":
-            content = self._generate_javascript_markdown(parsed_data)
-        elif language == "C++":
-            content = self._generate_cpp_markdown(parsed_data)
-        else:
-            content = self._generate_generic_markdown(parsed_data)
+        method_name = self._LANG_DISPATCH.get(language, "_generate_generic_markdown")
+        content = getattr(self, method_name)(parsed_data)
         
         # Write content to file
         file_path = os.path.join(self.output_dir, output_file)
-        with open(file_path, 'w', encoding='utf-8') as file:
-            file.write(content)
+        write_file(file_path, content)
         
         return file_path
 
@@ -71,69 +96,64 @@ class MarkdownGenerator:
         Returns:
             str: Markdown content for C# code.
         """
-        content = []
+        buf = io.StringIO()
+        write = buf.write
         
         # Add title
-        file_name = os.path.basename(parsed_data.get("file_path", "Unknown"))
-        content.append(f"# {file_name}\n")
+        file_name = _base_name(parsed_data.get("file_path", "Unknown"))
+        write(f"# {file_name}\n\n")
         
         # Add namespaces
-        namespaces = parsed_data.get("namespaces", [])
-        if namespaces:
-            content.append("## Namespaces\n")
+        if (namespaces := parsed_data.get("namespaces")):
+            write("## Namespaces\n\n")
             for namespace in namespaces:
-                content.append(f"- `{namespace}`\n")
-            content.append("")
+                write(f"- `{namespace}`\n\n")
+            write("\n")
         
         # Add using directives
-        using_directives = parsed_data.get("using_directives", [])
-        if using_directives:
-            content.append("## Using Directives\n")
+        if (using_directives := parsed_data.get("using_directives")):
+            write("## Using Directives\n\n")
             for directive in using_directives:
-                content.append(f"- `{directive}`\n")
-            content.append("")
+                write(f"- `{directive}`\n\n")
+            write("\n")
         
         # Add classes
-        classes = parsed_data.get("classes", [])
-        if classes:
+        if (classes := parsed_data.get("classes")):
             for class_info in classes:
-                content.append(f"## Class: {class_info['name']}\n")
+                write(f"## Class: {class_info['name']}\n\n")
                 
                 # Add base classes
-                base_classes = class_info.get("base_classes", [])
-                if base_classes:
-                    content.append("### Inherits From\n")
+                if (base_classes := class_info.get("base_classes")):
+                    write("### Inherits From\n\n")
                     for base in base_classes:
-                        content.append(f"- `{base}`\n")
-                    content.append("")
+                        write(f"- `{base}`\n\n")
+                    write("\n")
                 
                 # Add properties
-                properties = class_info.get("properties", [])
-                if properties:
-                    content.append("### Properties\n")
+                if (properties := class_info.get("properties")):
+                    write("### Properties\n\n")
                     for prop in properties:
-                        content.append(f"- `{prop['name']}`: {prop['type']}\n")
-                    content.append("")
+                        write(_PROP_LINE.format_map(prop))
+                    write("\n")
                 
                 # Add fields
-                fields = class_info.get("fields", [])
-                if fields:
-                    content.append("### Fields\n")
+                if (fields := class_info.get("fields")):
+                    write("### Fields\n\n")
                     for field in fields:
-                        content.append(f"- `{field['name']}`: {field['type']}\n")
-                    content.append("")
+                        write(_PROP_LINE.format_map(field))
+                    write("\n")
                 
                 # Add methods
-                methods = class_info.get("methods", [])
-                if methods:
-                    content.append("### Methods\n")
+                if (methods := class_info.get("methods")):
+                    write("### Methods\n\n")
                     for method in methods:
                         # Format parameters
-                        params_str = ", ".join([f"{param['type']} {param['name']}" for param in method.get("parameters", [])])
-                        content.append(f"- `{method['name']}({params_str})`: {method['return_type']}\n")
-                    content.append("")
+                        params_str = ", ".join(f"{param['type']} {param['name']}" for param in method.get("parameters", []))
+                        write(f"- `{method['name']}({params_str})`: {method['return_type']}\n\n")
+                    write("\n")
         
-        return "\n".join(content)
+        # Each block ends with a blank-line separator, except the last one
+        return buf.getvalue()[:-1]
 
     def _generate_shader_markdown(self, parsed_data: Dict[str, Any]) -> str:
         """
@@ -145,67 +165,63 @@ class MarkdownGenerator:
         Returns:
             str: Markdown content for Shader code.
         """
-        content = []
+        buf = io.StringIO()
+        write = buf.write
         
         # Add title
         shader_name = parsed_data.get("name", "Unknown Shader")
-        content.append(f"# Shader: {shader_name}\n")
+        write(f"# Shader: {shader_name}\n\n")
         
         # Add properties
-        properties = parsed_data.get("properties", [])
-        if properties:
-            content.append("## Properties\n")
+        if (properties := parsed_data.get("properties")):
+            write("## Properties\n\n")
             for prop in properties:
-                content.append(f"- `{prop['name']}`: {prop['type']} - {prop['display_name']}")
+                write(_SHADER_PROP_LINE.format_map(prop))
                 if "default_value" in prop:
-                    content.append(f" (Default: {prop['default_value']})")
-                content.append("\n")
-            content.append("")
+                    write(f" (Default: {prop['default_value']})\n")
+                write("\n\n")
+            write("\n")
         
         # Add subshaders
-        subshaders = parsed_data.get("subshaders", [])
-        if subshaders:
-            content.append("## SubShaders\n")
+        if (subshaders := parsed_data.get("subshaders")):
+            write("## SubShaders\n\n")
             for i, subshader in enumerate(subshaders):
-                content.append(f"### SubShader {i+1}\n")
+                write(f"### SubShader {i+1}\n\n")
                 
                 # Add tags
                 tags = subshader.get("tags", {})
                 if tags:
-                    content.append("#### Tags\n")
+                    write("#### Tags\n\n")
                     for tag_name, tag_value in tags.items():
-                        content.append(f"- `{tag_name}`: {tag_value}\n")
-                    content.append("")
+                        write(f"- `{tag_name}`: {tag_value}\n\n")
+                    write("\n")
                 
                 # Add passes
-                passes = subshader.get("passes", [])
-                if passes:
-                    content.append("#### Passes\n")
+                if (passes := subshader.get("passes")):
+                    write("#### Passes\n\n")
                     for j, pass_info in enumerate(passes):
                         pass_name = pass_info.get("name", f"Pass {j+1}")
-                        content.append(f"##### {pass_name}\n")
                         
                         # Add pass tags
                         pass_tags = pass_info.get("tags", {})
+                        tags_block = ""
                         if pass_tags:
-                            content.append("###### Tags\n")
-                            for tag_name, tag_value in pass_tags.items():
-                                content.append(f"- `{tag_name}`: {tag_value}\n")
-                            content.append("")
+                            tag_lines = "".join(f"- `{tag_name}`: {tag_value}\n\n" for tag_name, tag_value in pass_tags.items())
+                            tags_block = f"###### Tags\n\n{tag_lines}\n"
                         
                         # Add vertex program
                         vertex_program = pass_info.get("vertex_program", "")
-                        if vertex_program:
-                            content.append(f"###### Vertex Program: `{vertex_program}`\n")
+                        vertex_line = f"###### Vertex Program: `{vertex_program}`\n\n" if vertex_program else ""
                         
                         # Add fragment program
                         fragment_program = pass_info.get("fragment_program", "")
-                        if fragment_program:
-                            content.append(f"###### Fragment Program: `{fragment_program}`\n")
+                        fragment_line = f"###### Fragment Program: `{fragment_program}`\n\n" if fragment_program else ""
                         
-                        content.append("")
+                        # Write the whole pass at once
+                        write(f"##### {pass_name}\n\n{tags_block}{vertex_line}{fragment_line}\n")
         
-        return "\n".join(content)
+        # Each block ends with a blank-line separator, except the last one
+        return buf.getvalue()[:-1]
 
     def _generate_python_markdown(self, parsed_data: Dict[str, Any]) -> str:
         """
@@ -217,105 +233,100 @@ class MarkdownGenerator:
         Returns:
             str: Markdown content for Python code.
         """
-        content = []
+        buf = io.StringIO()
+        write = buf.write
         
         # Add title
-        file_name = os.path.basename(parsed_data.get("file_path", "Unknown"))
-        content.append(f"# Python Module: {file_name}\n")
+        file_name = _base_name(parsed_data.get("file_path", "Unknown"))
+        write(f"# Python Module: {file_name}\n\n")
         
         # Add imports
-        imports = parsed_data.get("imports", [])
-        if imports:
-            content.append("## Imports\n")
+        if (imports := parsed_data.get("imports")):
+            write("## Imports\n\n")
             for import_info in imports:
                 if import_info.get("type") == "import":
                     import_str = f"import {import_info['name']}"
                     if import_info.get("alias"):
                         import_str += f" as {import_info['alias']}"
-                    content.append(f"- `{import_str}`\n")
+                    write(f"- `{import_str}`\n\n")
                 elif import_info.get("type") == "from_import":
                     import_str = f"from {import_info['module']} import {import_info['name']}"
                     if import_info.get("alias"):
                         import_str += f" as {import_info['alias']}"
-                    content.append(f"- `{import_str}`\n")
-            content.append("")
+                    write(f"- `{import_str}`\n\n")
+            write("\n")
         
         # Add classes
-        classes = parsed_data.get("classes", [])
-        if classes:
+        if (classes := parsed_data.get("classes")):
             for class_info in classes:
-                content.append(f"## Class: {class_info['name']}\n")
+                write(f"## Class: {class_info['name']}\n\n")
                 
                 # Add docstring
                 docstring = class_info.get("docstring", "")
                 if docstring:
-                    content.append(f"{docstring}\n")
+                    write(f"{docstring}\n\n")
                 
                 # Add bases
-                bases = class_info.get("bases", [])
-                if bases:
-                    content.append("### Inherits From\n")
+                if (bases := class_info.get("bases")):
+                    write("### Inherits From\n\n")
                     for base in bases:
-                        content.append(f"- `{base}`\n")
-                    content.append("")
+                        write(f"- `{base}`\n\n")
+                    write("\n")
                 
                 # Add attributes
-                attributes = class_info.get("attributes", [])
-                if attributes:
-                    content.append("### Attributes\n")
+                if (attributes := class_info.get("attributes")):
+                    write("### Attributes\n\n")
                     for attr in attributes:
                         value_str = attr.get("value", "")
-                        content.append(f"- `{attr['name']}`: {value_str}\n")
-                    content.append("")
+                        write(f"- `{attr['name']}`: {value_str}\n\n")
+                    write("\n")
                 
                 # Add methods
-                methods = class_info.get("methods", [])
-                if methods:
-                    content.append("### Methods\n")
+                if (methods := class_info.get("methods")):
+                    write("### Methods\n\n")
                     for method in methods:
                         # Format parameters
                         params = method.get("parameters", [])
-                        params_str = ", ".join([f"{param['name']}: {param['type']}" if param.get("type") else param['name'] for param in params])
+                        params_str = ", ".join(f"{param['name']}: {param['type']}" if param.get("type") else param['name'] for param in params)
                         returns_str = f" -> {method['returns']}" if method.get("returns") else ""
                         
-                        content.append(f"#### `{method['name']}({params_str}){returns_str}`\n")
+                        write(f"#### `{method['name']}({params_str}){returns_str}`\n\n")
                         
                         # Add docstring
                         method_docstring = method.get("docstring", "")
                         if method_docstring:
-                            content.append(f"{method_docstring}\n")
+                            write(f"{method_docstring}\n\n")
                         
-                        content.append("")
+                        write("\n")
         
         # Add functions
-        functions = parsed_data.get("functions", [])
-        if functions:
-            content.append("## Functions\n")
+        if (functions := parsed_data.get("functions")):
+            write("## Functions\n\n")
             for function in functions:
                 # Format parameters
                 params = function.get("parameters", [])
-                params_str = ", ".join([f"{param['name']}: {param['type']}" if param.get("type") else param['name'] for param in params])
+                params_str = ", ".join(f"{param['name']}: {param['type']}" if param.get("type") else param['name'] for param in params)
                 returns_str = f" -> {function['returns']}" if function.get("returns") else ""
                 
-                content.append(f"### `{function['name']}({params_str}){returns_str}`\n")
+                write(f"### `{function['name']}({params_str}){returns_str}`\n\n")
                 
                 # Add docstring
                 function_docstring = function.get("docstring", "")
                 if function_docstring:
-                    content.append(f"{function_docstring}\n")
+                    write(f"{function_docstring}\n\n")
                 
-                content.append("")
+                write("\n")
         
         # Add global variables
-        globals_list = parsed_data.get("globals", [])
-        if globals_list:
-            content.append("## Global Variables\n")
+        if (globals_list := parsed_data.get("globals")):
+            write("## Global Variables\n\n")
             for global_var in globals_list:
                 value_str = global_var.get("value", "")
-                content.append(f"- `{global_var['name']}`: {value_str}\n")
-            content.append("")
+                write(f"- `{global_var['name']}`: {value_str}\n\n")
+            write("\n")
         
-        return "\n".join(content)
+        # Each block ends with a blank-line separator, except the last one
+        return buf.getvalue()[:-1]
 
     def _generate_javascript_markdown(self, parsed_data: Dict[str, Any]) -> str:
         """
@@ -327,77 +338,74 @@ class MarkdownGenerator:
         Returns:
             str: Markdown content for JavaScript code.
         """
-        content = []
+        buf = io.StringIO()
+        write = buf.write
         
         # Add title
-        file_name = os.path.basename(parsed_data.get("file_path", "Unknown"))
-        content.append(f"# JavaScript File: {file_name}\n")
+        file_name = _base_name(parsed_data.get("file_path", "Unknown"))
+        write(f"# JavaScript File: {file_name}\n\n")
         
         # Add imports
-        imports = parsed_data.get("imports", [])
-        if imports:
-            content.append("## Imports\n")
+        if (imports := parsed_data.get("imports")):
+            write("## Imports\n\n")
             for import_info in imports:
                 module = import_info.get("module", "")
                 
                 if import_info.get("type") == "named":
                     import_items = import_info.get("imports", [])
-                    content.append(f"- `import {{ {', '.join(import_items)} }} from '{module}'`\n")
+                    write(f"- `import {{ {', '.join(import_items)} }} from '{module}'`\n\n")
                 elif import_info.get("type") == "default":
                     import_name = import_info.get("import", "")
-                    content.append(f"- `import {import_name} from '{module}'`\n")
-            content.append("")
+                    write(f"- `import {import_name} from '{module}'`\n\n")
+            write("\n")
         
         # Add classes
-        classes = parsed_data.get("classes", [])
-        if classes:
+        if (classes := parsed_data.get("classes")):
             for class_info in classes:
-                content.append(f"## Class: {class_info['name']}\n")
+                write(f"## Class: {class_info['name']}\n\n")
                 
                 # Add parent class
                 parent = class_info.get("parent", "")
                 if parent:
-                    content.append(f"Extends: `{parent}`\n\n")
+                    write(f"Extends: `{parent}`\n\n\n")
                 
                 # Add properties
-                properties = class_info.get("properties", [])
-                if properties:
-                    content.append("### Properties\n")
+                if (properties := class_info.get("properties")):
+                    write("### Properties\n\n")
                     for prop in properties:
                         value_str = prop.get("value", "")
-                        content.append(f"- `{prop['name']}`: {value_str}\n")
-                    content.append("")
+                        write(f"- `{prop['name']}`: {value_str}\n\n")
+                    write("\n")
                 
                 # Add methods
-                methods = class_info.get("methods", [])
-                if methods:
-                    content.append("### Methods\n")
+                if (methods := class_info.get("methods")):
+                    write("### Methods\n\n")
                     for method in methods:
                         # Format parameters
                         params = method.get("parameters", [])
-                        params_str = ", ".join([param['name'] + (f" = {param['default']}" if "default" in param else "") for param in params])
+                        params_str = ", ".join(param['name'] + (f" = {param['default']}" if "default" in param else "") for param in params)
                         
-                        content.append(f"- `{method['name']}({params_str})`\n")
-                    content.append("")
+                        write(f"- `{method['name']}({params_str})`\n\n")
+                    write("\n")
         
         # Add functions
-        functions = parsed_data.get("functions", [])
-        if functions:
-            content.append("## Functions\n")
+        if (functions := parsed_data.get("functions")):
+            write("## Functions\n\n")
             for function in functions:
                 # Format parameters
                 params = function.get("parameters", [])
-                params_str = ", ".join([param['name'] + (f" = {param['default']}" if "default" in param else "") for param in params])
+                params_str = ", ".join(param['name'] + (f" = {param['default']}" if "default" in param else "") for param in params)
                 
                 function_type = function.get("type", "function")
                 if function_type == "function":
-                    content.append(f"### `function {function['name']}({params_str})`\n")
+                    write(f"### `function {function['name']}({params_str})`\n\n")
                 elif function_type == "arrow_function":
-                    content.append(f"### `const {function['name']} = ({params_str}) => {{}}`\n")
+                    write(f"### `const {function['name']} = ({params_str}) => {{}}`\n\n")
                 
-                content.append("")
+                write("\n")
         
-        return "\n".join(content)
+        # Each block ends with a blank-line separator, except the last one
+        return buf.getvalue()[:-1]
 
     def _generate_cpp_markdown(self, parsed_data: Dict[str, Any]) -> str:
         """
@@ -409,71 +417,66 @@ class MarkdownGenerator:
         Returns:
             str: Markdown content for C++ code.
         """
-        content = []
+        buf = io.StringIO()
+        write = buf.write
         
         # Add title
-        file_name = os.path.basename(parsed_data.get("file_path", "Unknown"))
-        content.append(f"# C++ File: {file_name}\n")
+        file_name = _base_name(parsed_data.get("file_path", "Unknown"))
+        write(f"# C++ File: {file_name}\n\n")
         
         # Add includes
-        includes = parsed_data.get("includes", [])
-        if includes:
-            content.append("## Includes\n")
+        if (includes := parsed_data.get("includes")):
+            write("## Includes\n\n")
             for include in includes:
-                content.append(f"- `#include <{include}>`\n")
-            content.append("")
+                write(f"- `#include <{include}>`\n\n")
+            write("\n")
         
         # Add namespaces
-        namespaces = parsed_data.get("namespaces", [])
-        if namespaces:
-            content.append("## Namespaces\n")
+        if (namespaces := parsed_data.get("namespaces")):
+            write("## Namespaces\n\n")
             for namespace in namespaces:
-                content.append(f"- `{namespace['name']}`\n")
-            content.append("")
+                write(f"- `{namespace['name']}`\n\n")
+            write("\n")
         
         # Add classes
-        classes = parsed_data.get("classes", [])
-        if classes:
+        if (classes := parsed_data.get("classes")):
             for class_info in classes:
-                content.append(f"## Class: {class_info['name']}\n")
+                write(f"## Class: {class_info['name']}\n\n")
                 
                 # Add base classes
-                base_classes = class_info.get("base_classes", [])
-                if base_classes:
-                    content.append("### Inherits From\n")
+                if (base_classes := class_info.get("base_classes")):
+                    write("### Inherits From\n\n")
                     for base in base_classes:
-                        content.append(f"- `{base}`\n")
-                    content.append("")
+                        write(f"- `{base}`\n\n")
+                    write("\n")
                 
                 # Add properties
-                properties = class_info.get("properties", [])
-                if properties:
-                    content.append("### Properties\n")
+                if (properties := class_info.get("properties")):
+                    write("### Properties\n\n")
                     for prop in properties:
-                        content.append(f"- `{prop['name']}`: {prop['type']}\n")
-                    content.append("")
+                        write(_PROP_LINE.format_map(prop))
+                    write("\n")
                 
                 # Add methods
-                methods = class_info.get("methods", [])
-                if methods:
-                    content.append("### Methods\n")
+                if (methods := class_info.get("methods")):
+                    write("### Methods\n\n")
                     for method in methods:
                         # Format parameters
-                        params_str = ", ".join([f"{param['type']} {param['name']}" if param['name'] else param['type'] for param in method.get("parameters", [])])
-                        content.append(f"- `{method['return_type']} {method['name']}({params_str})`\n")
-                    content.append("")
+                        params_str = ", ".join(f"{param['type']} {param['name']}" if param['name'] else param['type'] for param in method.get("parameters", []))
+                        write(f"- `{method['return_type']} {method['name']}({params_str})`\n\n")
+                    write("\n")
         
         # Add global functions
-        functions = parsed_data.get("functions", [])
-        if functions:
-            content.append("## Global Functions\n")
+        if (functions := parsed_data.get("functions")):
+            write("## Global Functions\n\n")
             for function in functions:
                 # Format parameters
-                params_str = ", ".join([f"{param['type']} {param['name']}" if param['name'] else param['type'] for param in function.get("parameters", [])])
-                content.append(f"- `{function['return_type']} {function['name']}({params_str})`\n")
-            content.append("")
+                params_str = ", ".join(f"{param['type']} {param['name']}" if param['name'] else param['type'] for param in function.get("parameters", []))
+                write(f"- `{function['return_type']} {function['name']}({params_str})`\n\n")
+            write("\n")
         
-        return "\n".join(content)
+        # Each block ends with a blank-line separator, except the last one
+        return buf.getvalue()[:-1]
 
     def _generate_generic_markdown(self, parsed_data: Dict[str, Any]) -> str:
         """
@@ -485,58 +488,72 @@ class MarkdownGenerator:
         Returns:
             str: Markdown content.
         """
-        content = []
+        buf = io.StringIO()
+        write = buf.write
         
         # Add title
-        file_name = os.path.basename(parsed_data.get("file_path", "Unknown"))
+        file_name = _base_name(parsed_data.get("file_path", "Unknown"))
         language = parsed_data.get("language", "Unknown")
-        content.append(f"# {language} File: {file_name}\n")
+        write(f"# {language} File: {file_name}\n\n")
         
         # Add error if present
         error = parsed_data.get("error", "")
         if error:
-            content.append(f"**Error**: {error}\n")
+            write(f"**Error**: {error}\n\n")
         
         # Recursively add all other data as sections
-        self._add_sections(content, parsed_data, 2)
+        self._add_sections(buf, parsed_data, 2)
         
-        return "\n".join(content)
+        # Each block ends with a blank-line separator, except the last one
+        return buf.getvalue()[:-1]
 
-    def _add_sections(self, content: List[str], data: Dict[str, Any], level: int):
+    def _add_sections(self, buf: io.StringIO, data: Dict[str, Any], level: int):
         """
-        Recursively add sections from a dictionary to the content list.
+        Add sections from a possibly nested dictionary to the content buffer.
+        
+        Nested dictionaries are walked with an explicit stack of item
+        iterators rather than recursion, so deep data neither pays a call
+        per level nor hits the recursion limit. Subsections are still
+        written right below their parent header.
 
         Args:
-            content: List to add content to.
+            buf: Buffer to write content to.
             data: Dictionary containing data to add.
-            level: Current heading level.
+            level: Heading level of the top-level keys.
         """
-        # Skip certain sections we don't want to include
-        skip_keys = ["language", "file_path", "error"]
-        
-        for key, value in data.items():
-            if key in skip_keys:
-                continue
-            
-            # Add section header
-            header = "#" * level
-            content.append(f"{header} {key.replace('_', ' ').title()}\n")
-            
-            # Handle different types of values
-            if isinstance(value, dict):
-                # Recursively add subsections for dictionaries
-                self._add_sections(content, value, level + 1)
-            elif isinstance(value, list):
-                # Add list items for lists
-                for item in value:
-                    if isinstance(item, dict):
-                        # Handle dictionaries in lists
-                        for item_key, item_value in item.items():
-                            content.append(f"- **{item_key}**: {item_value}\n")
-                    else:
-                        # Handle simple list items
-                        content.append(f"- {item}\n")
-                content.append("")
+        write = buf.write
+        stack = [(iter(data.items()), "#" * level)]
+        
+        while stack:
+            items, header = stack[-1]
+            for key, value in items:
+                # Skip certain sections we don't want to include
+                if key in _SKIP_SECTION_KEYS:
+                    continue
+                
+                # Add section header
+                write(f"{header} {key.replace('_', ' ').title()}\n\n")
+                
+                # Handle different types of values, parsed data only holds plain dicts and lists
+                value_type = type(value)
+                if value_type is dict:
+                    # Descend into subsections, resuming this level afterwards
+                    stack.append((iter(value.items()), header + "#"))
+                    break
+                elif value_type is list:
+                    # Add list items for lists
+                    for item in value:
+                        if type(item) is dict:
+                            # Handle dictionaries in lists
+                            for item_key, item_value in item.items():
+                                write(f"- **{item_key}**: {item_value}\n\n")
+                        else:
+                            # Handle simple list items
+                            write(f"- {item}\n\n")
+                    write("\n")
+                else:
+                    # Add simple values
+                    write(f"{value}\n\n\n")
             else:
-                # Add simple values
-                content.append(f"{value}\n\n")
+                # This level is exhausted
+                stack.pop()
@@ -9,12 +9,22 @@ This module provides functionality to generate Mermaid diagrams from parsed code
 import os
 from typing import Dict, List, Any, Optional
 
+from .writer import write_file
+
 
 class MermaidGenerator:
     """
     Generates Mermaid diagrams from parsed code data.
     """
 
+    # Class diagram method for each language, anything else gets an empty diagram
+    _CLASS_DIAGRAM_DISPATCH = {
+        "C#": "_add_csharp_classes",
+        "Python": "_add_python_classes",
+        "JavaScript": "_add_javascript_classes",
+        "C++": "_add_cpp_classes",
+    }
+
     def __init__(self, output_dir: str = "docs"):
         """
         Initialize the Mermaid diagram generator.
@@ -25,8 +35,7 @@ class MermaidGenerator:
         self.output_dir = output_dir
         
         # Create output directory if it doesn't exist
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+        os.makedirs(output_dir, exist_ok=True)
 
     def generate_class_diagram(self, parsed_data: Dict[str, Any], output_file: str) -> str:
         """
@@ -42,24 +51,19 @@ class MermaidGenerator:
         language = parsed_data.get("language", "Unknown")
         
         content = []
-        content.append("```mermaid")
-        content.append("classDiagram")
+        append = content.append
+        append("```mermaid")
+        append("classDiagram")
         
-        if language == "C#":
-            self._add_csharp_classes(content, parsed_data)
-        elif language == "Python":
-            self._add_python_classes(content, parsed_data)
-        elif language == "JavaScript":
-            self._add_javascript_classes(content, parsed_data)
-        elif language == "C++":
-            self._add_cpp_classes(content, parsed_data)
+        method_name = self._CLASS_DIAGRAM_DISPATCH.get(language)
+        if method_name is not None:
+            getattr(self, method_name)(content, parsed_data)
         
-        content.append("```")
+        append("```")
         
         # Write content to file
         file_path = os.path.join(self.output_dir, output_file)
-        with open(file_path, 'w', encoding='utf-8') as file:
-            file.write("\n".join(content))
+        write_file(file_path, "\n".join(content))
         
         return file_path
 
@@ -75,35 +79,35 @@ class MermaidGenerator:
             str: Path to the generated Mermaid diagram file.
         """
         content = []
-        content.append("```mermaid")
-        content.append("flowchart TD")
+        append = content.append
+        append("```mermaid")
+        append("flowchart TD")
         
         # This is a simplified implementation and will need to be expanded
         # based on how method calls are represented in the parsed data
         # Here we simply show how methods might be connected
         
         # Add nodes for classes and methods
-        classes = parsed_data.get("classes", [])
+        classes = parsed_data.get("classes", ())
         for i, class_info in enumerate(classes):
             class_name = class_info['name']
-            content.append(f"    C{i}[{class_name}]")
+            append(f"    C{i}[{class_name}]")
             
             # Add nodes for methods
-            methods = class_info.get("methods", [])
+            methods = class_info.get("methods", ())
             for j, method in enumerate(methods):
                 method_name = method['name']
-                content.append(f"    C{i}M{j}[{method_name}]")
-                content.append(f"    C{i} -->|has method| C{i}M{j}")
+                append(f"    C{i}M{j}[{method_name}]")
+                append(f"    C{i} -->|has method| C{i}M{j}")
         
         # Add connections between methods if we have call information
         # This would require additional parsing to determine method calls
         
-        content.append("```")
+        append("```")
         
         # Write content to file
         file_path = os.path.join(self.output_dir, output_file)
-        with open(file_path, 'w', encoding='utf-8') as file:
-            file.write("\n".join(content))
+        write_file(file_path, "\n".join(content))
         
         return file_path
 
@@ -119,8 +123,9 @@ class MermaidGenerator:
             str: Path to the generated Mermaid diagram file.
         """
         content = []
-        content.append("```mermaid")
-        content.append("graph TD")
+        append = content.append
+        append("```mermaid")
+        append("graph TD")
         
         language = parsed_data.get("language", "Unknown")
         
@@ -130,12 +135,11 @@ class MermaidGenerator:
             # Generic structure for other languages
             self._add_generic_structure(content, parsed_data)
         
-        content.append("```")
+        append("```")
         
         # Write content to file
         file_path = os.path.join(self.output_dir, output_file)
-        with open(file_path, 'w', encoding='utf-8') as file:
-            file.write("\n".join(content))
+        write_file(file_path, "\n".join(content))
         
         return file_path
 
@@ -147,51 +151,52 @@ class MermaidGenerator:
             content: List of Mermaid diagram content lines.
             parsed_data: Dictionary containing parsed C# code data.
         """
-        classes = parsed_data.get("classes", [])
+        append = content.append
+        classes = parsed_data.get("classes", ())
         
         # Define class nodes and relationships
         for class_info in classes:
             class_name = class_info['name']
             
             # Add class
-            content.append(f"    class {class_name} {{")
+            append(f"    class {class_name} {{")
             
             # Add properties
-            properties = class_info.get("properties", [])
+            properties = class_info.get("properties", ())
             for prop in properties:
-                content.append(f"        +{prop['type']} {prop['name']}")
+                append(f"        +{prop['type']} {prop['name']}")
             
             # Add fields
-            fields = class_info.get("fields", [])
+            fields = class_info.get("fields", ())
             for field in fields:
                 modifier = field.get("modifier", "")
                 modifier_symbol = "-" if modifier == "private" else "+"
-                content.append(f"        {modifier_symbol}{field['type']} {field['name']}")
+                append(f"        {modifier_symbol}{field['type']} {field['name']}")
             
             # Add methods
-            methods = class_info.get("methods", [])
+            methods = class_info.get("methods", ())
             for method in methods:
                 modifier = method.get("modifier", "")
                 modifier_symbol = "-" if modifier == "private" else "+"
                 
                 # Format parameters
-                params_str = ", ".join([f"{param['type']} {param['name']}" for param in method.get("parameters", [])])
+                params_str = ", ".join([f"{param['type']} {param['name']}" for param in method.get("parameters", ())])
                 
-                content.append(f"        {modifier_symbol}{method['name']}({params_str}) {method['return_type']}")
+                append(f"        {modifier_symbol}{method['name']}({params_str}) {method['return_type']}")
             
-            content.append("    }")
+            append("    }")
             
             # Add inheritance relationships
-            base_classes = class_info.get("base_classes", [])
+            base_classes = class_info.get("base_classes", ())
             for base in base_classes:
                 # Skip interfaces for now
                 if not base.startswith("I"):
-                    content.append(f"    {base} <|-- {class_name}")
+                    append(f"    {base} <|-- {class_name}")
             
             # Add interface implementation
-            interfaces = [base for base in class_info.get("base_classes", []) if base.startswith("I")]
+            interfaces = [base for base in base_classes if base.startswith("I")]
             for interface in interfaces:
-                content.append(f"    {class_name} ..|> {interface} : implements")
+                append(f"    {class_name} ..|> {interface} : implements")
 
     def _add_python_classes(self, content: List[str], parsed_data: Dict[str, Any]):
         """
@@ -201,25 +206,26 @@ class MermaidGenerator:
             content: List of Mermaid diagram content lines.
             parsed_data: Dictionary containing parsed Python code data.
         """
-        classes = parsed_data.get("classes", [])
+        append = content.append
+        classes = parsed_data.get("classes", ())
         
         # Define class nodes and relationships
         for class_info in classes:
             class_name = class_info['name']
             
             # Add class
-            content.append(f"    class {class_name} {{")
+            append(f"    class {class_name} {{")
             
             # Add attributes
-            attributes = class_info.get("attributes", [])
+            attributes = class_info.get("attributes", ())
             for attr in attributes:
-                content.append(f"        +{attr['name']}")
+                append(f"        +{attr['name']}")
             
             # Add methods
-            methods = class_info.get("methods", [])
+            methods = class_info.get("methods", ())
             for method in methods:
                 # Format parameters
-                params = method.get("parameters", [])
+                params = method.get("parameters", ())
                 
                 # Skip 'self' parameter
                 if params and params[0]['name'] == 'self':
@@ -232,14 +238,14 @@ class MermaidGenerator:
                 
                 returns_str = f" {method['returns']}" if method.get("returns") else ""
                 
-                content.append(f"        {modifier_symbol}{method['name']}({params_str}){returns_str}")
+                append(f"        {modifier_symbol}{method['name']}({params_str}){returns_str}")
             
-            content.append("    }")
+            append("    }")
             
             # Add inheritance relationships
-            bases = class_info.get("bases", [])
+            bases = class_info.get("bases", ())
             for base in bases:
-                content.append(f"    {base} <|-- {class_name}")
+                append(f"    {base} <|-- {class_name}")
 
     def _add_javascript_classes(self, content: List[str], parsed_data: Dict[str, Any]):
         """
@@ -249,40 +255,41 @@ class MermaidGenerator:
             content: List of Mermaid diagram content lines.
             parsed_data: Dictionary containing parsed JavaScript code data.
         """
-        classes = parsed_data.get("classes", [])
+        append = content.append
+        classes = parsed_data.get("classes", ())
         
         # Define class nodes and relationships
         for class_info in classes:
             class_name = class_info['name']
             
             # Add class
-            content.append(f"    class {class_name} {{")
+            append(f"    class {class_name} {{")
             
             # Add properties
-            properties = class_info.get("properties", [])
+            properties = class_info.get("properties", ())
             for prop in properties:
                 # Use private property notation for properties starting with underscore
                 modifier_symbol = "-" if prop['name'].startswith("_") else "+"
-                content.append(f"        {modifier_symbol}{prop['name']}")
+                append(f"        {modifier_symbol}{prop['name']}")
             
             # Add methods
-            methods = class_info.get("methods", [])
+            methods = class_info.get("methods", ())
             for method in methods:
                 # Format parameters
-                params = method.get("parameters", [])
+                params = method.get("parameters", ())
                 params_str = ", ".join([param['name'] for param in params])
                 
                 # Use private method notation for methods starting with underscore
                 modifier_symbol = "-" if method['name'].startswith("_") else "+"
                 
-                content.append(f"        {modifier_symbol}{method['name']}({params_str})")
+                append(f"        {modifier_symbol}{method['name']}({params_str})")
             
-            content.append("    }")
+            append("    }")
             
             # Add inheritance relationships
             parent = class_info.get("parent", "")
             if parent:
-                content.append(f"    {parent} <|-- {class_name}")
+                append(f"    {parent} <|-- {class_name}")
 
     def _add_cpp_classes(self, content: List[str], parsed_data: Dict[str, Any]):
         """
@@ -292,34 +299,35 @@ class MermaidGenerator:
             content: List of Mermaid diagram content lines.
             parsed_data: Dictionary containing parsed C++ code data.
         """
-        classes = parsed_data.get("classes", [])
+        append = content.append
+        classes = parsed_data.get("classes", ())
         
         # Define class nodes and relationships
         for class_info in classes:
             class_name = class_info['name']
             
             # Add class
-            content.append(f"    class {class_name} {{")
+            append(f"    class {class_name} {{")
             
             # Add properties
-            properties = class_info.get("properties", [])
+            properties = class_info.get("properties", ())
             for prop in properties:
-                content.append(f"        +{prop['type']} {prop['name']}")
+                append(f"        +{prop['type']} {prop['name']}")
             
             # Add methods
-            methods = class_info.get("methods", [])
+            methods = class_info.get("methods", ())
             for method in methods:
                 # Format parameters
-                params_str = ", ".join([f"{param['type']} {param['name']}" if param['name'] else param['type'] for param in method.get("parameters", [])])
+                params_str = ", ".join([f"{param['type']} {param['name']}" if param['name'] else param['type'] for param in method.get("parameters", ())])
                 
-                content.append(f"        +{method['return_type']} {method['name']}({params_str})")
+                append(f"        +{method['return_type']} {method['name']}({params_str})")
             
-            content.append("    }")
+            append("    }")
             
             # Add inheritance relationships
-            base_classes = class_info.get("base_classes", [])
+            base_classes = class_info.get("base_classes", ())
             for base in base_classes:
-                content.append(f"    {base} <|-- {class_name}")
+                append(f"    {base} <|-- {class_name}")
 
     def _add_shader_structure(self, content: List[str], parsed_data: Dict[str, Any]):
         """
@@ -329,44 +337,43 @@ class MermaidGenerator:
             content: List of Mermaid diagram content lines.
             parsed_data: Dictionary containing parsed Shader code data.
         """
+        append = content.append
+        extend = content.extend
         shader_name = parsed_data.get("name", "Unknown Shader")
         
         # Add shader node
-        content.append(f"    Shader[\"{shader_name}\"]")
+        append(f"    Shader[\"{shader_name}\"]")
         
         # Add properties
-        content.append("    Properties[\"Properties\"]")
-        content.append("    Shader --> Properties")
+        append("    Properties[\"Properties\"]")
+        append("    Shader --> Properties")
         
-        properties = parsed_data.get("properties", [])
-        for i, prop in enumerate(properties):
-            prop_name = prop['name']
-            content.append(f"    Prop{i}[\"{prop_name}: {prop['type']}\"]")
-            content.append(f"    Properties --> Prop{i}")
+        properties = parsed_data.get("properties", ())
+        extend([
+            line
+            for i, prop in enumerate(properties)
+            for line in (f"    Prop{i}[\"{prop['name']}: {prop['type']}\"]", f"    Properties --> Prop{i}")
+        ])
         
         # Add subshaders
-        subshaders = parsed_data.get("subshaders", [])
+        subshaders = parsed_data.get("subshaders", ())
         for i, subshader in enumerate(subshaders):
-            content.append(f"    SubShader{i}[\"SubShader {i+1}\"]")
-            content.append(f"    Shader --> SubShader{i}")
+            extend((f"    SubShader{i}[\"SubShader {i+1}\"]", f"    Shader --> SubShader{i}"))
             
             # Add passes
-            passes = subshader.get("passes", [])
+            passes = subshader.get("passes", ())
             for j, pass_info in enumerate(passes):
                 pass_name = pass_info.get("name", f"Pass {j+1}")
-                content.append(f"    Pass{i}_{j}[\"{pass_name}\"]")
-                content.append(f"    SubShader{i} --> Pass{i}_{j}")
+                extend((f"    Pass{i}_{j}[\"{pass_name}\"]", f"    SubShader{i} --> Pass{i}_{j}"))
                 
                 # Add vertex and fragment programs
                 vertex_program = pass_info.get("vertex_program", "")
                 if vertex_program:
-                    content.append(f"    Vertex{i}_{j}[\"Vertex Program: {vertex_program}\"]")
-                    content.append(f"    Pass{i}_{j} --> Vertex{i}_{j}")
+                    extend((f"    Vertex{i}_{j}[\"Vertex Program: {vertex_program}\"]", f"    Pass{i}_{j} --> Vertex{i}_{j}"))
                 
                 fragment_program = pass_info.get("fragment_program", "")
                 if fragment_program:
-                    content.append(f"    Fragment{i}_{j}[\"Fragment Program: {fragment_program}\"]")
-                    content.append(f"    Pass{i}_{j} --> Fragment{i}_{j}")
+                    extend((f"    Fragment{i}_{j}[\"Fragment Program: {fragment_program}\"]", f"    Pass{i}_{j} --> Fragment{i}_{j}"))
 
     def _add_generic_structure(self, content: List[str], parsed_data: Dict[str, Any]):
         """
@@ -376,41 +383,41 @@ class MermaidGenerator:
             content: List of Mermaid diagram content lines.
             parsed_data: Dictionary containing parsed code data.
         """
+        append = content.append
+        extend = content.extend
         file_name = os.path.basename(parsed_data.get("file_path", "Unknown"))
         language = parsed_data.get("language", "Unknown")
         
         # Add file node
-        content.append(f"    File[\"{file_name} ({language})\"]")
+        append(f"    File[\"{file_name} ({language})\"]")
         
         # Add classes
-        classes = parsed_data.get("classes", [])
+        classes = parsed_data.get("classes", ())
         if classes:
-            content.append("    Classes[\"Classes\"]")
-            content.append("    File --> Classes")
+            append("    Classes[\"Classes\"]")
+            append("    File --> Classes")
             
             for i, class_info in enumerate(classes):
-                class_name = class_info['name']
-                content.append(f"    Class{i}[\"{class_name}\"]")
-                content.append(f"    Classes --> Class{i}")
+                extend((f"    Class{i}[\"{class_info['name']}\"]", f"    Classes --> Class{i}"))
                 
                 # Add methods
-                methods = class_info.get("methods", [])
+                methods = class_info.get("methods", ())
                 if methods:
-                    content.append(f"    Methods{i}[\"Methods\"]")
-                    content.append(f"    Class{i} --> Methods{i}")
-                    
-                    for j, method in enumerate(methods):
-                        method_name = method['name']
-                        content.append(f"    Method{i}_{j}[\"{method_name}\"]")
-                        content.append(f"    Methods{i} --> Method{i}_{j}")
+                    extend((f"    Methods{i}[\"Methods\"]", f"    Class{i} --> Methods{i}"))
+                    extend([
+                        line
+                        for j, method in enumerate(methods)
+                        for line in (f"    Method{i}_{j}[\"{method['name']}\"]", f"    Methods{i} --> Method{i}_{j}")
+                    ])
         
         # Add functions
-        functions = parsed_data.get("functions", [])
+        functions = parsed_data.get("functions", ())
         if functions:
-            content.append("    Functions[\"Functions\"]")
-            content.append("    File --> Functions")
+            append("    Functions[\"Functions\"]")
+            append("    File --> Functions")
             
-            for i, function in enumerate(functions):
-                function_name = function['name']
-                content.append(f"    Function{i}[\"{function_name}\"]")
-                content.append(f"    Functions --> Function{i}")
+            extend([
+                line
+                for i, function in enumerate(functions)
+                for line in (f"    Function{i}[\"{function['name']}\"]", f"    Functions --> Function{i}")
+            ])
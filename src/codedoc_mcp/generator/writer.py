@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Output writer module.
+This module provides the file writing shared by the documentation generators.
+"""
+
+import os
+import threading
+
+# Flags for creating the temporary output files as raw bytes
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+
+def write_file(file_path: str, content: str) -> None:
+    """
+    Write text to a file atomically with one encode and as few system calls as possible.
+
+    The content is encoded once and handed to os.write directly, bypassing
+    the text and buffered io layers. Line endings are translated like text
+    mode would. The data goes to a temporary file that is moved into place,
+    so concurrent writers and readers never see a partially written file.
+
+    Args:
+        file_path: Path of the file to write.
+        content: Text to write.
+    """
+    if os.linesep != "\n":
+        content = content.replace("\n", os.linesep)
+    data = memoryview(content.encode("utf-8"))
+    
+    tmp_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    fd = os.open(tmp_path, _WRITE_FLAGS, 0o666)
+    try:
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
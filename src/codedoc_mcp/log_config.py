@@ -17,6 +17,8 @@ def setup_logging() -> None:
     """Set up logging configuration.
     
     Configures loguru logger with appropriate format and log file location.
+    Messages are queued and written by a background thread, so logging
+    calls do not block on console or file I/O.
     """
     # Create log directory if it doesn't exist
     log_dir = Path(user_log_dir(APP_NAME))
@@ -33,6 +35,7 @@ def setup_logging() -> None:
         sys.stderr,
         level="INFO",
         format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
+        enqueue=True,
     )
     
     # Add file handler
@@ -42,6 +45,7 @@ def setup_logging() -> None:
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
         rotation="10 MB",
         retention="1 week",
+        enqueue=True,
     )
     
     logger.info(f"Log file: {log_file}")
@@ -6,9 +6,44 @@ Base parser module for code parsing.
 This module provides a base class for all language-specific parsers.
 """
 
+import mmap
+import os
+import re
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional
 
+from loguru import logger
+
+# Files at least this large are decoded straight from a memory map
+MMAP_THRESHOLD = 64 * 1024
+
+# Comments of C-like languages (group 1), and the string and character
+# literals that have to be skipped so comment markers inside them are kept:
+# C++ raw strings R"delim(...)delim", C# raw strings """...""", C# verbatim
+# strings @"...", $@"..." and @$"...", and regular strings and characters
+_COMMENT_RE = re.compile(
+    r"(//[^\n]*|/\*.*?(?:\*/|\Z))"
+    r"|(?<!\w)(?:u8|[uUL])?R\"([^()\\\s\"]{0,16})\(.*?\)\2\""
+    r"|\$*(\"{3,}).*?\3"
+    r"|(?:@\$?|\$@)\"(?:[^\"]|\"\")*\""
+    r"|\"(?:\\.|[^\"\\\n])*\""
+    r"|'(?:\\.|[^'\\\n])*'",
+    re.DOTALL
+)
+
+
+def _blank_comment(match: re.Match) -> str:
+    """
+    Replace a comment with a single space and keep literals as they are.
+
+    Args:
+        match: A match of the comment pattern.
+
+    Returns:
+        str: The replacement text.
+    """
+    return " " if match.lastindex == 1 else match.group()
+
 
 class BaseParser(ABC):
     """
@@ -16,28 +51,143 @@ class BaseParser(ABC):
     All language-specific parsers should inherit from this class.
     """
 
+    __slots__ = ('file_path', '_content', '_content_bytes', '_code')
+
     def __init__(self, file_path: str):
         """
         Initialize the parser with a file path.
 
+        Args:
+            file_path: Path to the code file to parse.
+        """
+        self.reset(file_path)
+
+    def reset(self, file_path: str) -> None:
+        """
+        Point the parser at another file, discarding per-file state.
+
         Args:
             file_path: Path to the code file to parse.
         """
         self.file_path = file_path
-        self.content = self._read_file()
+        self._content = None
+        self._content_bytes = None
+        self._code = None
+        self._reset_state()
+
+    def _reset_state(self) -> None:
+        """
+        Discard state derived from the content.
+        
+        Called whenever the parser gets another file or new content.
+        Subclasses that keep per-file state must extend this method.
+        """
+
+    @property
+    def content(self) -> str:
+        """
+        Content of the file, read on first access.
+
+        Returns:
+            str: The content of the file.
+        """
+        if self._content is None:
+            self._content = self._read_file()
+        return self._content
+
+    @content.setter
+    def content(self, content: str) -> None:
+        """
+        Replace the content, e.g. to parse text that is not on disk.
+        
+        The raw and comment-free views are derived from the new text, and
+        everything parsed from the previous content is discarded.
+
+        Args:
+            content: The code to parse.
+        """
+        self._content = content
+        self._content_bytes = content.encode('utf-8')
+        self._code = None
+        self._reset_state()
+
+    @property
+    def code(self) -> str:
+        """
+        Content of the file with C-style comments blanked out, built on first access.
+        
+        For the parsers of C-like languages, so declarations in comments
+        are neither matched nor scanned by their patterns. Each comment
+        becomes a single space; string and character literals are kept.
+
+        Returns:
+            str: The content of the file without comments.
+        """
+        if self._code is None:
+            content = self.content
+            self._code = _COMMENT_RE.sub(_blank_comment, content) if '/' in content else content
+        return self._code
+
+    @property
+    def content_bytes(self) -> bytes:
+        """
+        Raw content of the file, read on first access.
+        
+        For parsers that can consume undecoded source directly, so the text
+        content is never built for them.
+
+        Returns:
+            bytes: The content of the file.
+        """
+        if self._content_bytes is None:
+            self._content_bytes = self._read_bytes()
+        return self._content_bytes
+
+    def _read_bytes(self) -> bytes:
+        """
+        Read the raw content of the file with a single os.read.
+
+        Returns:
+            bytes: The content of the file.
+        """
+        try:
+            fd = os.open(self.file_path, os.O_RDONLY)
+            try:
+                return os.read(fd, os.fstat(fd).st_size)
+            finally:
+                os.close(fd)
+        except OSError as e:
+            logger.warning(f"Error reading file {self.file_path}: {str(e)}")
+            return b""
 
     def _read_file(self) -> str:
         """
         Read the content of the file.
+        
+        The file is read with a single os.read of its known size, bypassing
+        the buffered io layer. Large files are decoded straight from a
+        read-only memory map, so no intermediate bytes copy is held next to
+        the decoded text. Line endings are normalized like text mode does.
 
         Returns:
             str: The content of the file.
         """
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as file:
-                return file.read()
-        except Exception as e:
-            print(f"Error reading file {self.file_path}: {str(e)}")
+            fd = os.open(self.file_path, os.O_RDONLY)
+            try:
+                size = os.fstat(fd).st_size
+                if size < MMAP_THRESHOLD:
+                    content = os.read(fd, size).decode('utf-8')
+                else:
+                    with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+                        content = str(mapped, 'utf-8')
+            finally:
+                os.close(fd)
+            if '\r' in content:
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
+            return content
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning(f"Error reading file {self.file_path}: {str(e)}")
             return ""
 
     @abstractmethod
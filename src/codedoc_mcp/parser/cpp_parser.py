@@ -7,9 +7,59 @@ This module provides functionality to parse C++ code files.
 """
 
 import re
-from typing import Dict, List, Any, Optional
+import sys
+from typing import Dict, List, Any, Optional, Set
 from .base_parser import BaseParser
 
+# Regex patterns for C++ parsing, compiled once for all files. Methods and
+# functions are only tried at word boundaries, a match starting inside a word
+# captures the same groups as the one starting at the next word.
+_CLASS_RE = re.compile(r"(?:class|struct)\s+(\w+)(?:\s*:\s*(?:public|protected|private)\s+([^{]+))?\s*\{")
+_METHOD_RE = re.compile(r"\b(?:virtual\s+)?(?:static\s+)?(?:inline\s+)?(?:explicit\s+)?(?:const\s+)?(\w+(?:<[^>]+>)?)\s+(\w+)\s*\(([^)]*)\)(?:\s*const)?\s*(?:=\s*0)?\s*(?:override)?\s*(?:final)?\s*(?:noexcept)?\s*(?:;\s*|\{)")
+_PROPERTY_RE = re.compile(r"(?:public|protected|private):\s*(?:static\s+)?(?:const\s+)?(\w+(?:<[^>]+>)?)\s+(\w+)(?:\s*=\s*[^;]+)?;")
+_FUNCTION_RE = re.compile(r"\b(?:static\s+)?(?:inline\s+)?(?:explicit\s+)?(?:const\s+)?(\w+(?:<[^>]+>)?)\s+(\w+)\s*\(([^)]*)\)(?:\s*const)?\s*(?:noexcept)?\s*(?:;\s*|\{)")
+_NAMESPACE_RE = re.compile(r"namespace\s+(\w+)\s*\{")
+_INCLUDE_RE = re.compile(r"#include\s+[<\"]([^>\"]+)[>\"]")
+_CLASS_HEAD_RE = re.compile(r"class\s+\w+\s*\{")
+_CALL_NAME_RE = re.compile(r"(\w+)\s*\(")
+_BRACE_RE = re.compile(r"[{}]")
+_LIST_SEPARATOR_RE = re.compile(r"[<>,]")
+
+
+def _split_top_level(text: str) -> List[str]:
+    """
+    Split a comma separated list, keeping commas inside template arguments.
+    
+    Only commas and angle brackets are visited, the text in between is
+    sliced out whole. A trailing empty item is dropped.
+    
+    Args:
+        text: The list to split.
+        
+    Returns:
+        List[str]: The unstripped items of the list.
+    """
+    if '<' not in text and '>' not in text:
+        items = text.split(',')
+    else:
+        items = []
+        bracket_count = 0
+        item_start = 0
+        for separator in _LIST_SEPARATOR_RE.finditer(text):
+            char = separator.group()
+            if char == '<':
+                bracket_count += 1
+            elif char == '>':
+                bracket_count -= 1
+            elif bracket_count == 0:
+                items.append(text[item_start:separator.start()])
+                item_start = separator.end()
+        items.append(text[item_start:])
+    
+    if not items[-1]:
+        items.pop()
+    return items
+
 
 class CppParser(BaseParser):
     """
@@ -17,6 +67,8 @@ class CppParser(BaseParser):
     Extracts classes, methods, properties, and functions from C++ code files.
     """
 
+    __slots__ = ('_classes',)
+
     def __init__(self, file_path: str):
         """
         Initialize the C++ parser with a file path.
@@ -25,13 +77,12 @@ class CppParser(BaseParser):
             file_path: Path to the C++ file to parse.
         """
         super().__init__(file_path)
-        # Regex patterns for C++ parsing
-        self.class_pattern = r"(?:class|struct)\s+(\w+)(?:\s*:\s*(?:public|protected|private)\s+([^{]+))?\s*\{"
-        self.method_pattern = r"(?:virtual\s+)?(?:static\s+)?(?:inline\s+)?(?:explicit\s+)?(?:const\s+)?(\w+(?:<[^>]+>)?)\s+(\w+)\s*\(([^)]*)\)(?:\s*const)?\s*(?:=\s*0)?\s*(?:override)?\s*(?:final)?\s*(?:noexcept)?\s*(?:;\s*|\{)"
-        self.property_pattern = r"(?:public|protected|private):\s*(?:static\s+)?(?:const\s+)?(\w+(?:<[^>]+>)?)\s+(\w+)(?:\s*=\s*[^;]+)?;"
-        self.function_pattern = r"(?:static\s+)?(?:inline\s+)?(?:explicit\s+)?(?:const\s+)?(\w+(?:<[^>]+>)?)\s+(\w+)\s*\(([^)]*)\)(?:\s*const)?\s*(?:noexcept)?\s*(?:;\s*|\{)"
-        self.namespace_pattern = r"namespace\s+(\w+)\s*\{"
-        self.include_pattern = r"#include\s+[<\"]([^>\"]+)[>\"]"
+
+    def _reset_state(self) -> None:
+        """
+        Discard the results cached for the previous content.
+        """
+        self._classes = None
 
     def parse(self) -> Dict[str, Any]:
         """
@@ -54,52 +105,45 @@ class CppParser(BaseParser):
         """
         Extract classes information from the C++ code.
         
+        Returns:
+            List[Dict[str, Any]]: A list of dictionaries, each containing information about a class.
+        """
+        if self._classes is None:
+            self._classes = self._find_classes()
+        return self._classes
+
+    def _find_classes(self) -> List[Dict[str, Any]]:
+        """
+        Scan the content for classes.
+        
         Returns:
             List[Dict[str, Any]]: A list of dictionaries, each containing information about a class.
         """
         classes = []
         
-        for match in re.finditer(self.class_pattern, self.content):
+        for match in _CLASS_RE.finditer(self.code):
             class_name = match.group(1)
             base_classes_str = match.group(2) if match.group(2) else ""
             
-            # Parse base classes
-            base_classes = []
-            if base_classes_str:
-                # Split by commas, but be careful of template parameters which might contain commas
-                current = ""
-                bracket_count = 0
-                
-                for char in base_classes_str:
-                    if char == '<':
-                        bracket_count += 1
-                        current += char
-                    elif char == '>':
-                        bracket_count -= 1
-                        current += char
-                    elif char == ',' and bracket_count == 0:
-                        base_classes.append(current.strip())
-                        current = ""
-                    else:
-                        current += char
-                
-                if current:
-                    base_classes.append(current.strip())
+            # Parse base classes, template parameters might contain commas
+            base_classes = [base_class.strip() for base_class in _split_top_level(base_classes_str)]
             
             # Find the class body
-            class_start = self.content.find('{', match.end())
+            class_start = self.code.find('{', match.end())
             if class_start > 0:
-                # Find the matching closing brace
+                # Find the matching closing brace, stepping from brace to brace
                 brace_count = 1
-                class_end = class_start + 1
-                while brace_count > 0 and class_end < len(self.content):
-                    if self.content[class_end] == '{':
+                class_end = len(self.code)
+                for brace in _BRACE_RE.finditer(self.code, class_start + 1):
+                    if brace.group() == '{':
                         brace_count += 1
-                    elif self.content[class_end] == '}':
+                    else:
                         brace_count -= 1
-                    class_end += 1
+                        if brace_count == 0:
+                            class_end = brace.end()
+                            break
                 
-                class_content = self.content[class_start:class_end]
+                class_content = self.code[class_start:class_end]
                 
                 class_info = {
                     "name": class_name,
@@ -123,8 +167,7 @@ class CppParser(BaseParser):
         
         for class_info in self.get_classes():
             for method in class_info.get("methods", []):
-                method["class"] = class_info["name"]
-                all_methods.append(method)
+                all_methods.append({**method, "class": class_info["name"]})
                 
         return all_methods
 
@@ -139,8 +182,7 @@ class CppParser(BaseParser):
         
         for class_info in self.get_classes():
             for prop in class_info.get("properties", []):
-                prop["class"] = class_info["name"]
-                all_properties.append(prop)
+                all_properties.append({**prop, "class": class_info["name"]})
                 
         return all_properties
 
@@ -152,15 +194,11 @@ class CppParser(BaseParser):
             List[Dict[str, Any]]: A list of dictionaries, each containing information about a function.
         """
         functions = []
+        class_member_names = self._get_class_member_names()
         
-        for match in re.finditer(self.function_pattern, self.content):
-            return_type = match.group(1)
-            function_name = match.group(2)
-            parameters_str = match.group(3)
-            
+        for return_type, function_name, parameters_str in _FUNCTION_RE.findall(self.code):
             # Skip if this is a method of a class (we handle those separately)
-            class_pattern = r"class\s+\w+\s*\{[^}]*" + function_name + r"\s*\("
-            if re.search(class_pattern, self.content):
+            if function_name in class_member_names:
                 continue
             
             # Parse parameters
@@ -168,7 +206,7 @@ class CppParser(BaseParser):
             
             function_info = {
                 "name": function_name,
-                "return_type": return_type,
+                "return_type": sys.intern(return_type),
                 "parameters": parameters
             }
             
@@ -176,6 +214,28 @@ class CppParser(BaseParser):
             
         return functions
 
+    def _get_class_member_names(self) -> Set[str]:
+        """
+        Collect the names followed by a parameter list in class bodies.
+        
+        Each class body is scanned once, up to its first closing brace, so
+        functions can be told apart from methods by a set lookup instead of
+        searching the whole file again for every function.
+        
+        Returns:
+            Set[str]: The method names found in class bodies.
+        """
+        content = self.code
+        names = set()
+        
+        for match in _CLASS_HEAD_RE.finditer(content):
+            body_end = content.find('}', match.end())
+            if body_end == -1:
+                body_end = len(content)
+            names.update(_CALL_NAME_RE.findall(content, match.end(), body_end))
+            
+        return names
+
     def get_namespaces(self) -> List[Dict[str, Any]]:
         """
         Extract namespaces from the C++ code.
@@ -185,9 +245,7 @@ class CppParser(BaseParser):
         """
         namespaces = []
         
-        for match in re.finditer(self.namespace_pattern, self.content):
-            namespace_name = match.group(1)
-            
+        for namespace_name in _NAMESPACE_RE.findall(self.code):
             namespace_info = {
                 "name": namespace_name
             }
@@ -203,13 +261,7 @@ class CppParser(BaseParser):
         Returns:
             List[str]: A list of include files.
         """
-        includes = []
-        
-        for match in re.finditer(self.include_pattern, self.content):
-            include_file = match.group(1)
-            includes.append(include_file)
-            
-        return includes
+        return _INCLUDE_RE.findall(self.code)
 
     def _extract_class_methods(self, class_content: str) -> List[Dict[str, Any]]:
         """
@@ -223,17 +275,13 @@ class CppParser(BaseParser):
         """
         methods = []
         
-        for match in re.finditer(self.method_pattern, class_content):
-            return_type = match.group(1)
-            method_name = match.group(2)
-            parameters_str = match.group(3)
-            
+        for return_type, method_name, parameters_str in _METHOD_RE.findall(class_content):
             # Parse parameters
             parameters = self._parse_parameters(parameters_str)
             
             method_info = {
                 "name": method_name,
-                "return_type": return_type,
+                "return_type": sys.intern(return_type),
                 "parameters": parameters
             }
             
@@ -254,13 +302,10 @@ class CppParser(BaseParser):
         properties = []
         
         # Regular expression for C++ class properties
-        for match in re.finditer(self.property_pattern, class_content):
-            property_type = match.group(1)
-            property_name = match.group(2)
-            
+        for property_type, property_name in _PROPERTY_RE.findall(class_content):
             property_info = {
                 "name": property_name,
-                "type": property_type
+                "type": sys.intern(property_type)
             }
             
             properties.append(property_info)
@@ -277,30 +322,11 @@ class CppParser(BaseParser):
         Returns:
             List[Dict[str, str]]: A list of dictionaries, each containing information about a parameter.
         """
-        parameters = []
+        if not parameters_str.strip():
+            return []
         
-        if parameters_str.strip():
-            # Split by commas, but be careful of template parameters which might contain commas
-            current = ""
-            bracket_count = 0
-            
-            for char in parameters_str:
-                if char == '<':
-                    bracket_count += 1
-                    current += char
-                elif char == '>':
-                    bracket_count -= 1
-                    current += char
-                elif char == ',' and bracket_count == 0:
-                    parameters.append(self._parse_single_parameter(current.strip()))
-                    current = ""
-                else:
-                    current += char
-            
-            if current:
-                parameters.append(self._parse_single_parameter(current.strip()))
-                
-        return parameters
+        # Split by commas, but be careful of template parameters which might contain commas
+        return [self._parse_single_parameter(param.strip()) for param in _split_top_level(parameters_str)]
 
     def _parse_single_parameter(self, param_str: str) -> Dict[str, str]:
         """
@@ -334,9 +360,10 @@ class CppParser(BaseParser):
                 param_type += ' ' + param_name[0]
                 param_name = param_name[1:]
         
+        # Types such as int or const std::string & repeat across many signatures
         param_info = {
             "name": param_name,
-            "type": param_type
+            "type": sys.intern(param_type)
         }
         
         if param_default:
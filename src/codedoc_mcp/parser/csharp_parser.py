@@ -7,9 +7,21 @@ This module provides functionality to parse C# code files, specifically Unity C#
 """
 
 import re
+import sys
 from typing import Dict, List, Any, Optional
 from .base_parser import BaseParser
 
+# Regex patterns for C# parsing, compiled once for all files. Without an access
+# modifier a match can only start where a whitespace run begins, starts inside
+# the run would find the same match, so the lookbehind skips them cheaply.
+_CLASS_RE = re.compile(r"(?:public|private|protected|internal|(?<!\s))\s+(?:class|struct|interface)\s+(\w+)(?:\s*:\s*([^{]+))?")
+_METHOD_RE = re.compile(r"(?:public|private|protected|internal|(?<!\s))\s+(?:virtual|override|abstract|static)?\s+(\w+(?:<[^>]+>)?)\s+(\w+)\s*\(([^)]*)\)")
+_PROPERTY_RE = re.compile(r"(?:public|private|protected|internal|(?<!\s))\s+(?:virtual|override|abstract|static)?\s+(\w+(?:<[^>]+>)?)\s+(\w+)\s*\{(?:\s*get\s*;\s*set\s*;|\s*get\s*;\s*|\s*set\s*;\s*|\s*[^}]+)\}")
+_FIELD_RE = re.compile(r"(?:public|private|protected|internal|(?<!\s))\s+(?:readonly|static|const)?\s+(\w+(?:<[^>]+>)?)\s+(\w+)\s*=?[^;]*;")
+_NAMESPACE_RE = re.compile(r"namespace\s+([^\s{;]+)")
+_USING_RE = re.compile(r"using\s+([^;]+);")
+_BRACE_RE = re.compile(r"[{}]")
+
 
 class CSharpParser(BaseParser):
     """
@@ -17,6 +29,8 @@ class CSharpParser(BaseParser):
     Extracts classes, methods, properties, and fields from C# code files.
     """
 
+    __slots__ = ('_classes',)
+
     def __init__(self, file_path: str):
         """
         Initialize the C# parser with a file path.
@@ -25,10 +39,12 @@ class CSharpParser(BaseParser):
             file_path: Path to the C# file to parse.
         """
         super().__init__(file_path)
-        self.class_pattern = r"(?:public|private|protected|internal)?\s+(?:class|struct|interface)\s+(\w+)(?:\s*:\s*([^{]+))?"
-        self.method_pattern = r"(?:public|private|protected|internal)?\s+(?:virtual|override|abstract|static)?\s+(\w+(?:<[^>]+>)?)\s+(\w+)\s*\(([^)]*)\)"
-        self.property_pattern = r"(?:public|private|protected|internal)?\s+(?:virtual|override|abstract|static)?\s+(\w+(?:<[^>]+>)?)\s+(\w+)\s*\{(?:\s*get\s*;\s*set\s*;|\s*get\s*;\s*|\s*set\s*;\s*|\s*[^}]+)\}"
-        self.field_pattern = r"(?:public|private|protected|internal)?\s+(?:readonly|static|const)?\s+(\w+(?:<[^>]+>)?)\s+(\w+)\s*=?[^;]*;"
+
+    def _reset_state(self) -> None:
+        """
+        Discard the results cached for the previous content.
+        """
+        self._classes = None
 
     def parse(self) -> Dict[str, Any]:
         """
@@ -51,11 +67,22 @@ class CSharpParser(BaseParser):
         """
         Extract classes information from the C# code.
         
+        Returns:
+            List[Dict[str, Any]]: A list of dictionaries, each containing information about a class.
+        """
+        if self._classes is None:
+            self._classes = self._find_classes()
+        return self._classes
+
+    def _find_classes(self) -> List[Dict[str, Any]]:
+        """
+        Scan the content for classes.
+        
         Returns:
             List[Dict[str, Any]]: A list of dictionaries, each containing information about a class.
         """
         classes = []
-        for match in re.finditer(self.class_pattern, self.content):
+        for match in _CLASS_RE.finditer(self.code):
             class_name = match.group(1)
             base_classes = match.group(2).split(',') if match.group(2) else []
             
@@ -71,20 +98,22 @@ class CSharpParser(BaseParser):
             }
             
             # Find the class content between { and matching }
-            class_start = self.content.find('{', match.end())
+            class_start = self.code.find('{', match.end())
             if class_start != -1:
-                # Find the matching closing brace
+                # Find the matching closing brace, stepping from brace to brace
                 brace_count = 1
-                class_end = class_start + 1
-                while brace_count > 0 and class_end < len(self.content):
-                    if self.content[class_end] == '{':
+                class_end = len(self.code)
+                for brace in _BRACE_RE.finditer(self.code, class_start + 1):
+                    if brace.group() == '{':
                         brace_count += 1
-                    elif self.content[class_end] == '}':
+                    else:
                         brace_count -= 1
-                    class_end += 1
+                        if brace_count == 0:
+                            class_end = brace.end()
+                            break
                 
                 # Extract methods and properties within the class
-                class_content = self.content[class_start:class_end]
+                class_content = self.code[class_start:class_end]
                 
                 # Add methods, properties, and fields to class_info
                 # This would require additional parsing logic
@@ -101,11 +130,7 @@ class CSharpParser(BaseParser):
             List[Dict[str, Any]]: A list of dictionaries, each containing information about a method.
         """
         methods = []
-        for match in re.finditer(self.method_pattern, self.content):
-            return_type = match.group(1)
-            method_name = match.group(2)
-            parameters_str = match.group(3)
-            
+        for return_type, method_name, parameters_str in _METHOD_RE.findall(self.code):
             # Parse parameters
             parameters = []
             if parameters_str:
@@ -116,13 +141,13 @@ class CSharpParser(BaseParser):
                         param_type = ' '.join(param_parts[:-1])
                         param_name = param_parts[-1]
                         parameters.append({
-                            "type": param_type.strip(),
+                            "type": sys.intern(param_type.strip()),
                             "name": param_name.strip()
                         })
             
             method_info = {
                 "name": method_name,
-                "return_type": return_type,
+                "return_type": sys.intern(return_type),
                 "parameters": parameters
             }
             
@@ -138,13 +163,10 @@ class CSharpParser(BaseParser):
             List[Dict[str, Any]]: A list of dictionaries, each containing information about a property.
         """
         properties = []
-        for match in re.finditer(self.property_pattern, self.content):
-            property_type = match.group(1)
-            property_name = match.group(2)
-            
+        for property_type, property_name in _PROPERTY_RE.findall(self.code):
             property_info = {
                 "name": property_name,
-                "type": property_type
+                "type": sys.intern(property_type)
             }
             
             properties.append(property_info)
@@ -159,13 +181,10 @@ class CSharpParser(BaseParser):
             List[Dict[str, Any]]: A list of dictionaries, each containing information about a field.
         """
         fields = []
-        for match in re.finditer(self.field_pattern, self.content):
-            field_type = match.group(1)
-            field_name = match.group(2)
-            
+        for field_type, field_name in _FIELD_RE.findall(self.code):
             field_info = {
                 "name": field_name,
-                "type": field_type
+                "type": sys.intern(field_type)
             }
             
             fields.append(field_info)
@@ -179,8 +198,7 @@ class CSharpParser(BaseParser):
         Returns:
             List[str]: A list of namespace names.
         """
-        namespace_pattern = r"namespace\s+([^\s{;]+)"
-        return [match.group(1) for match in re.finditer(namespace_pattern, self.content)]
+        return _NAMESPACE_RE.findall(self.code)
     
     def get_using_directives(self) -> List[str]:
         """
@@ -189,5 +207,4 @@ class CSharpParser(BaseParser):
         Returns:
             List[str]: A list of using directive statements.
         """
-        using_pattern = r"using\s+([^;]+);"
-        return [match.group(1).strip() for match in re.finditer(using_pattern, self.content)]
+        return [directive.strip() for directive in _USING_RE.findall(self.code)]
@@ -10,6 +10,20 @@ import re
 from typing import Dict, List, Any, Optional
 from .base_parser import BaseParser
 
+# Regex patterns for JavaScript parsing, compiled once for all files
+_CLASS_RE = re.compile(r"class\s+(\w+)(?:\s+extends\s+(\w+))?\s*\{")
+_FUNCTION_RE = re.compile(r"(?:async\s+)?function\s+(\w+)\s*\(([^)]*)\)\s*\{")
+_ARROW_FUNCTION_RE = re.compile(r"(?:const|let|var)\s+(\w+)\s*=\s*(?:async\s+)?\(([^)]*)\)\s*=>\s*[{]?")
+_IMPORT_RE = re.compile(r"import\s+(?:{([^}]+)}|([^{][^;]+))\s+from\s+['\"]([^'\"]+)['\"]")
+# Class method pattern for ES6 classes, skipping control flow statements in method bodies
+_CLASS_METHOD_RE = re.compile(
+    r"(?:async\s+)?\b(?!(?:if|for|while|switch|catch|return|function)\b)(\w+)\s*\(([^)]*)\)\s*\{"
+)
+_CONSTRUCTOR_RE = re.compile(r"constructor\s*\(([^)]*)\)\s*\{([^}]+)}", re.DOTALL)
+_PROPERTY_RE = re.compile(r"this\.(\w+)\s*=\s*([^;]+);")
+_FIELD_RE = re.compile(r"(\w+)\s*=\s*([^;]+);")
+_BRACE_RE = re.compile(r"[{}]")
+
 
 class JavaScriptParser(BaseParser):
     """
@@ -17,6 +31,8 @@ class JavaScriptParser(BaseParser):
     Extracts classes, methods, properties, and functions from JavaScript code files.
     """
 
+    __slots__ = ('_classes', '_functions', '_imports')
+
     def __init__(self, file_path: str):
         """
         Initialize the JavaScript parser with a file path.
@@ -25,13 +41,14 @@ class JavaScriptParser(BaseParser):
             file_path: Path to the JavaScript file to parse.
         """
         super().__init__(file_path)
-        # Regex patterns for JavaScript parsing
-        self.class_pattern = r"class\s+(\w+)(?:\s+extends\s+(\w+))?\s*\{"
-        self.method_pattern = r"(?:async\s+)?(?:function\s+)?(\w+)\s*\(([^)]*)\)\s*\{"
-        self.property_pattern = r"this\.(\w+)\s*=\s*([^;]+);"
-        self.function_pattern = r"(?:async\s+)?function\s+(\w+)\s*\(([^)]*)\)\s*\{"
-        self.arrow_function_pattern = r"(?:const|let|var)\s+(\w+)\s*=\s*(?:async\s+)?\(([^)]*)\)\s*=>\s*[{]?"
-        self.import_pattern = r"import\s+(?:{([^}]+)}|([^{][^;]+))\s+from\s+['\"]([^'\"]+)['\"]"
+
+    def _reset_state(self) -> None:
+        """
+        Discard the results cached for the previous content.
+        """
+        self._classes = None
+        self._functions = None
+        self._imports = None
 
     def parse(self) -> Dict[str, Any]:
         """
@@ -53,38 +70,64 @@ class JavaScriptParser(BaseParser):
         """
         Extract classes information from the JavaScript code.
         
+        Returns:
+            List[Dict[str, Any]]: A list of dictionaries, each containing information about a class.
+        """
+        if self._classes is None:
+            self._walk()
+        return self._classes
+
+    def _walk(self) -> None:
+        """
+        Extract classes, functions and imports in one go.
+        
+        Each pattern scans the content once per file; the results are cached
+        until reset, and methods and properties are derived from the cached
+        classes. The patterns are not fused into a single alternation, as
+        that would drop matches overlapping another construct.
+        """
+        self._classes = self._find_classes()
+        self._functions = self._find_functions()
+        self._imports = self._find_imports()
+
+    def _find_classes(self) -> List[Dict[str, Any]]:
+        """
+        Scan the content for classes.
+        
         Returns:
             List[Dict[str, Any]]: A list of dictionaries, each containing information about a class.
         """
         classes = []
         
-        for match in re.finditer(self.class_pattern, self.content):
+        for match in _CLASS_RE.finditer(self.content):
             class_name = match.group(1)
             parent_class = match.group(2) if match.group(2) else ""
             
-            # Find the class body
-            class_start = self.content.find('{', match.end() - 1) + 1
-            if class_start > 0:
-                # Find the matching closing brace
-                brace_count = 1
-                class_end = class_start
-                while brace_count > 0 and class_end < len(self.content):
-                    if self.content[class_end] == '{':
-                        brace_count += 1
-                    elif self.content[class_end] == '}':
-                        brace_count -= 1
-                    class_end += 1
-                
-                class_body = self.content[class_start:class_end-1]
-                
-                class_info = {
-                    "name": class_name,
-                    "parent": parent_class,
-                    "methods": self._extract_class_methods(class_body),
-                    "properties": self._extract_class_properties(class_body)
-                }
-                
-                classes.append(class_info)
+            # The pattern ends with the opening brace, the body starts right after it
+            class_start = match.end()
+            
+            # Find the matching closing brace, stepping from brace to brace
+            brace_count = 1
+            class_end = len(self.content)
+            for brace in _BRACE_RE.finditer(self.content, class_start):
+                if brace.group() == '{':
+                    brace_count += 1
+                else:
+                    brace_count -= 1
+                    if brace_count == 0:
+                        class_end = brace.end()
+                        break
+            
+            class_body = self.content[class_start:class_end-1]
+            
+            class_info = {
+                "name": class_name,
+                "parent": parent_class,
+                "methods": self._extract_class_methods(class_body),
+                "properties": self._extract_class_properties(class_body)
+            }
+            
+            classes.append(class_info)
                 
         return classes
 
@@ -99,8 +142,7 @@ class JavaScriptParser(BaseParser):
         
         for class_info in self.get_classes():
             for method in class_info.get("methods", []):
-                method["class"] = class_info["name"]
-                all_methods.append(method)
+                all_methods.append({**method, "class": class_info["name"]})
                 
         return all_methods
 
@@ -115,8 +157,7 @@ class JavaScriptParser(BaseParser):
         
         for class_info in self.get_classes():
             for prop in class_info.get("properties", []):
-                prop["class"] = class_info["name"]
-                all_properties.append(prop)
+                all_properties.append({**prop, "class": class_info["name"]})
                 
         return all_properties
 
@@ -124,13 +165,24 @@ class JavaScriptParser(BaseParser):
         """
         Extract global functions from the JavaScript code.
         
+        Returns:
+            List[Dict[str, Any]]: A list of dictionaries, each containing information about a function.
+        """
+        if self._functions is None:
+            self._walk()
+        return self._functions
+
+    def _find_functions(self) -> List[Dict[str, Any]]:
+        """
+        Scan the content for regular and arrow functions.
+        
         Returns:
             List[Dict[str, Any]]: A list of dictionaries, each containing information about a function.
         """
         functions = []
         
         # Regular functions
-        for match in re.finditer(self.function_pattern, self.content):
+        for match in _FUNCTION_RE.finditer(self.content):
             function_name = match.group(1)
             parameters_str = match.group(2)
             
@@ -146,7 +198,7 @@ class JavaScriptParser(BaseParser):
             functions.append(function_info)
             
         # Arrow functions
-        for match in re.finditer(self.arrow_function_pattern, self.content):
+        for match in _ARROW_FUNCTION_RE.finditer(self.content):
             function_name = match.group(1)
             parameters_str = match.group(2)
             
@@ -167,12 +219,23 @@ class JavaScriptParser(BaseParser):
         """
         Extract import statements from the JavaScript code.
         
+        Returns:
+            List[Dict[str, Any]]: A list of dictionaries, each containing information about an import.
+        """
+        if self._imports is None:
+            self._walk()
+        return self._imports
+
+    def _find_imports(self) -> List[Dict[str, Any]]:
+        """
+        Scan the content for import statements.
+        
         Returns:
             List[Dict[str, Any]]: A list of dictionaries, each containing information about an import.
         """
         imports = []
         
-        for match in re.finditer(self.import_pattern, self.content):
+        for match in _IMPORT_RE.finditer(self.content):
             named_imports = match.group(1)
             default_import = match.group(2)
             module_path = match.group(3)
@@ -204,10 +267,7 @@ class JavaScriptParser(BaseParser):
         """
         methods = []
         
-        # Class method pattern for ES6 classes
-        class_method_pattern = r"(?:async\s+)?(\w+)\s*\(([^)]*)\)\s*\{"
-        
-        for match in re.finditer(class_method_pattern, class_body):
+        for match in _CLASS_METHOD_RE.finditer(class_body):
             method_name = match.group(1)
             parameters_str = match.group(2)
             
@@ -236,14 +296,13 @@ class JavaScriptParser(BaseParser):
         properties = []
         
         # Look for constructor
-        constructor_pattern = r"constructor\s*\(([^)]*)\)\s*\{([^}]+)}"
-        constructor_match = re.search(constructor_pattern, class_body, re.DOTALL)
+        constructor_match = _CONSTRUCTOR_RE.search(class_body)
         
         if constructor_match:
             constructor_body = constructor_match.group(2)
             
             # Extract properties initialized in constructor
-            for match in re.finditer(self.property_pattern, constructor_body):
+            for match in _PROPERTY_RE.finditer(constructor_body):
                 prop_name = match.group(1)
                 prop_value = match.group(2)
                 
@@ -255,14 +314,15 @@ class JavaScriptParser(BaseParser):
                 properties.append(property_info)
                 
         # Look for class fields (a more modern JavaScript feature)
-        field_pattern = r"(\w+)\s*=\s*([^;]+);"
-        
-        for match in re.finditer(field_pattern, class_body):
+        method_names = None
+        for match in _FIELD_RE.finditer(class_body):
             field_name = match.group(1)
             field_value = match.group(2)
             
             # Skip if the field name is a method we've already extracted
-            if any(method["name"] == field_name for method in self._extract_class_methods(class_body)):
+            if method_names is None:
+                method_names = {method["name"] for method in self._extract_class_methods(class_body)}
+            if field_name in method_names:
                 continue
                 
             property_info = {
@@ -291,12 +351,12 @@ class JavaScriptParser(BaseParser):
                 param = param.strip()
                 if param:
                     # Handle default parameters
-                    param_parts = param.split('=')
-                    param_name = param_parts[0].strip()
-                    param_default = param_parts[1].strip() if len(param_parts) > 1 else None
+                    param_name, has_default, param_default = param.partition('=')
+                    param_name = param_name.strip()
+                    param_default = param_default.strip() if has_default else None
                     
                     # Handle destructuring
-                    if param_name.startswith('{') or param_name.startswith('['):
+                    if param_name.startswith(('{', '[')):
                         param_name = "destructured"
                     
                     param_info = {
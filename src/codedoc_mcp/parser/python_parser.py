@@ -7,9 +7,19 @@ This module provides functionality to parse Python code files.
 """
 
 import ast
+import sys
 from typing import Dict, List, Any, Optional
+
+from loguru import logger
+
 from .base_parser import BaseParser
 
+# Fields holding nested statements, the only places classes and imports can appear
+_BLOCK_FIELDS = frozenset(("body", "orelse", "finalbody", "handlers", "cases"))
+
+# Block fields of each node type, filled on first sight of the type
+_block_fields_by_type: Dict[type, tuple] = {}
+
 
 class PythonParser(BaseParser):
     """
@@ -17,6 +27,15 @@ class PythonParser(BaseParser):
     Extracts classes, methods, functions, and variables from Python code files.
     """
 
+    __slots__ = ('ast_tree', '_classes', '_imports', '_functions', '_globals')
+
+    # Collector method for each node type gathered while walking the tree
+    _COLLECTORS = {
+        ast.ClassDef: "_collect_class",
+        ast.Import: "_collect_import",
+        ast.ImportFrom: "_collect_import_from",
+    }
+
     def __init__(self, file_path: str):
         """
         Initialize the Python parser with a file path.
@@ -25,11 +44,23 @@ class PythonParser(BaseParser):
             file_path: Path to the Python file to parse.
         """
         super().__init__(file_path)
+
+    def _reset_state(self) -> None:
+        """
+        Discard the results cached for the previous content and parse the syntax tree.
+        
+        The raw bytes are handed to ast.parse, which decodes them itself and
+        so also honours BOMs and PEP 263 encoding declarations.
+        """
         self.ast_tree = None
+        self._classes = None
+        self._imports = None
+        self._functions = None
+        self._globals = None
         try:
-            self.ast_tree = ast.parse(self.content)
+            self.ast_tree = ast.parse(self.content_bytes, filename=self.file_path)
         except SyntaxError as e:
-            print(f"Error parsing Python file {self.file_path}: {str(e)}")
+            logger.warning(f"Error parsing Python file {self.file_path}: {str(e)}")
 
     def parse(self) -> Dict[str, Any]:
         """
@@ -61,22 +92,9 @@ class PythonParser(BaseParser):
         """
         if not self.ast_tree:
             return []
-            
-        classes = []
-        
-        for node in ast.walk(self.ast_tree):
-            if isinstance(node, ast.ClassDef):
-                class_info = {
-                    "name": node.name,
-                    "bases": [self._get_name(base) for base in node.bases],
-                    "methods": self._get_class_methods(node),
-                    "attributes": self._get_class_attributes(node),
-                    "docstring": ast.get_docstring(node) or ""
-                }
-                
-                classes.append(class_info)
-                
-        return classes
+        if self._classes is None:
+            self._collect_all()
+        return self._classes
 
     def get_methods(self) -> List[Dict[str, Any]]:
         """
@@ -89,8 +107,7 @@ class PythonParser(BaseParser):
         
         for class_info in self.get_classes():
             for method in class_info.get("methods", []):
-                method["class"] = class_info["name"]
-                all_methods.append(method)
+                all_methods.append({**method, "class": class_info["name"]})
                 
         return all_methods
 
@@ -105,8 +122,7 @@ class PythonParser(BaseParser):
         
         for class_info in self.get_classes():
             for attr in class_info.get("attributes", []):
-                attr["class"] = class_info["name"]
-                all_properties.append(attr)
+                all_properties.append({**attr, "class": class_info["name"]})
                 
         return all_properties
 
@@ -119,24 +135,9 @@ class PythonParser(BaseParser):
         """
         if not self.ast_tree:
             return []
-            
-        functions = []
-        class_function_names = set()
-        
-        # 首先收集所有类方法的名称，以便排除它们
-        for node in ast.walk(self.ast_tree):
-            if isinstance(node, ast.ClassDef):
-                for item in node.body:
-                    if isinstance(item, ast.FunctionDef):
-                        class_function_names.add(item.name)
-        
-        # 然后收集所有不在类中定义的函数
-        for node in ast.iter_child_nodes(self.ast_tree):
-            if isinstance(node, ast.FunctionDef) and node.name not in class_function_names:
-                function_info = self._extract_function_info(node)
-                functions.append(function_info)
-                
-        return functions
+        if self._functions is None:
+            self._collect_all()
+        return self._functions
 
     def get_imports(self) -> List[Dict[str, Any]]:
         """
@@ -147,31 +148,9 @@ class PythonParser(BaseParser):
         """
         if not self.ast_tree:
             return []
-            
-        imports = []
-        
-        for node in ast.walk(self.ast_tree):
-            if isinstance(node, ast.Import):
-                for name in node.names:
-                    import_info = {
-                        "type": "import",
-                        "name": name.name,
-                        "alias": name.asname
-                    }
-                    imports.append(import_info)
-                    
-            elif isinstance(node, ast.ImportFrom):
-                module = node.module or ""
-                for name in node.names:
-                    import_info = {
-                        "type": "from_import",
-                        "module": module,
-                        "name": name.name,
-                        "alias": name.asname
-                    }
-                    imports.append(import_info)
-                    
-        return imports
+        if self._imports is None:
+            self._collect_all()
+        return self._imports
 
     def get_globals(self) -> List[Dict[str, Any]]:
         """
@@ -182,20 +161,108 @@ class PythonParser(BaseParser):
         """
         if not self.ast_tree:
             return []
+        if self._globals is None:
+            self._collect_all()
+        return self._globals
+
+    def _collect_all(self) -> None:
+        """
+        Extract classes, imports, functions and globals in one traversal.
+        
+        The tree is walked once, in the same breadth-first order as ast.walk,
+        dispatching on the node type. Only statement blocks are descended
+        into, since expressions can never contain classes or imports. The
+        results are cached until reset.
+        """
+        self._classes = []
+        self._imports = []
+        collectors = {node_type: getattr(self, name) for node_type, name in self._COLLECTORS.items()}
+        block_fields_by_type = _block_fields_by_type
+        
+        nodes = [self.ast_tree]
+        extend = nodes.extend
+        for node in nodes:
+            node_type = node.__class__
+            collector = collectors.get(node_type)
+            if collector is not None:
+                collector(node)
             
+            block_fields = block_fields_by_type.get(node_type)
+            if block_fields is None:
+                block_fields = tuple(field for field in node_type._fields if field in _BLOCK_FIELDS)
+                block_fields_by_type[node_type] = block_fields
+            for field in block_fields:
+                extend(getattr(node, field))
+        self._scan_module()
+
+    def _collect_class(self, node: ast.ClassDef) -> None:
+        """
+        Record a class definition.
+        
+        Args:
+            node: The class AST node.
+        """
+        self._classes.append({
+            "name": node.name,
+            "bases": [self._get_name(base) for base in node.bases],
+            "methods": self._get_class_methods(node),
+            "attributes": self._get_class_attributes(node),
+            "docstring": ast.get_docstring(node) or ""
+        })
+
+    def _collect_import(self, node: ast.Import) -> None:
+        """
+        Record the names of an import statement.
+        
+        Args:
+            node: The import AST node.
+        """
+        for name in node.names:
+            self._imports.append({
+                "type": "import",
+                "name": name.name,
+                "alias": name.asname
+            })
+
+    def _collect_import_from(self, node: ast.ImportFrom) -> None:
+        """
+        Record the names of a from-import statement.
+        
+        Args:
+            node: The from-import AST node.
+        """
+        module = node.module or ""
+        for name in node.names:
+            self._imports.append({
+                "type": "from_import",
+                "module": module,
+                "name": name.name,
+                "alias": name.asname
+            })
+
+    def _scan_module(self) -> None:
+        """
+        Extract the module-level functions and variables in one pass over the module body.
+        """
+        functions = []
         globals_list = []
         
-        for node in ast.iter_child_nodes(self.ast_tree):
-            if isinstance(node, ast.Assign) and not isinstance(node.targets[0], ast.Attribute):
+        # 模块的直接子节点不可能定义在类中，无需排除类方法
+        for node in self.ast_tree.body:
+            node_type = node.__class__
+            if node_type is ast.FunctionDef:
+                functions.append(self._extract_function_info(node))
+            elif node_type is ast.Assign and node.targets[0].__class__ is not ast.Attribute:
+                value = self._get_value(node.value)
                 for target in node.targets:
-                    if isinstance(target, ast.Name):
-                        global_info = {
+                    if target.__class__ is ast.Name:
+                        globals_list.append({
                             "name": target.id,
-                            "value": self._get_value(node.value)
-                        }
-                        globals_list.append(global_info)
-                        
-        return globals_list
+                            "value": value
+                        })
+        
+        self._functions = functions
+        self._globals = globals_list
 
     def _get_class_methods(self, class_node: ast.ClassDef) -> List[Dict[str, Any]]:
         """
@@ -207,14 +274,11 @@ class PythonParser(BaseParser):
         Returns:
             List[Dict[str, Any]]: A list of dictionaries, each containing information about a method.
         """
-        methods = []
-        
-        for node in class_node.body:
-            if isinstance(node, ast.FunctionDef):
-                method_info = self._extract_function_info(node)
-                methods.append(method_info)
-                
-        return methods
+        return [
+            self._extract_function_info(node)
+            for node in class_node.body
+            if node.__class__ is ast.FunctionDef
+        ]
 
     def _get_class_attributes(self, class_node: ast.ClassDef) -> List[Dict[str, Any]]:
         """
@@ -226,19 +290,16 @@ class PythonParser(BaseParser):
         Returns:
             List[Dict[str, Any]]: A list of dictionaries, each containing information about an attribute.
         """
-        attributes = []
-        
-        for node in class_node.body:
-            if isinstance(node, ast.Assign):
-                for target in node.targets:
-                    if isinstance(target, ast.Name):
-                        attr_info = {
-                            "name": target.id,
-                            "value": self._get_value(node.value)
-                        }
-                        attributes.append(attr_info)
-                        
-        return attributes
+        return [
+            {
+                "name": target.id,
+                "value": self._get_value(node.value)
+            }
+            for node in class_node.body
+            if node.__class__ is ast.Assign
+            for target in node.targets
+            if target.__class__ is ast.Name
+        ]
 
     def _extract_function_info(self, func_node: ast.FunctionDef) -> Dict[str, Any]:
         """
@@ -250,14 +311,13 @@ class PythonParser(BaseParser):
         Returns:
             Dict[str, Any]: A dictionary containing information about the function.
         """
-        params = []
-        
-        for arg in func_node.args.args:
-            param_info = {
+        params = [
+            {
                 "name": arg.arg,
                 "type": self._get_annotation(arg.annotation)
             }
-            params.append(param_info)
+            for arg in func_node.args.args
+        ]
             
         return_type = self._get_annotation(func_node.returns)
         
@@ -280,42 +340,28 @@ class PythonParser(BaseParser):
         """
         if annotation is None:
             return "Any"
-            
-        if isinstance(annotation, ast.Name):
-            return annotation.id
-        elif isinstance(annotation, ast.Attribute):
-            return f"{self._get_name(annotation.value)}.{annotation.attr}"
-        elif isinstance(annotation, ast.Subscript):
-            return f"{self._get_name(annotation.value)}[{self._get_name(annotation.slice)}]"
-        else:
-            return str(annotation)
+        # Identifiers are already interned by the compiler, but rendered
+        # annotations such as Optional[str] repeat across many signatures
+        return sys.intern(self._get_name(annotation))
 
     def _get_name(self, node) -> str:
         """
-        Get the string representation of a name node.
+        Get the source representation of a name, attribute or other expression node.
         
         Args:
-            node: The name AST node.
+            node: The expression AST node.
             
         Returns:
-            str: The string representation of the name.
+            str: The string representation of the node.
         """
-        if isinstance(node, ast.Name):
+        # Plain names are by far the most common, skip the unparser for them
+        if node.__class__ is ast.Name:
             return node.id
-        elif isinstance(node, ast.Attribute):
-            return f"{self._get_name(node.value)}.{node.attr}"
-        elif isinstance(node, ast.Str):
-            return node.s
-        elif isinstance(node, ast.Constant):
-            return str(node.value)
-        elif isinstance(node, ast.Subscript):
-            return f"{self._get_name(node.value)}[{self._get_name(node.slice)}]"
-        else:
-            return str(node)
+        return ast.unparse(node)
 
     def _get_value(self, node) -> str:
         """
-        Get the string representation of a value node.
+        Get the source representation of a value node.
         
         Args:
             node: The value AST node.
@@ -323,27 +369,4 @@ class PythonParser(BaseParser):
         Returns:
             str: The string representation of the value.
         """
-        if isinstance(node, ast.Str):
-            return f'"{node.s}"'
-        elif isinstance(node, ast.Num):
-            return str(node.n)
-        elif isinstance(node, ast.Constant):
-            if isinstance(node.value, str):
-                return f'"{node.value}"'
-            return str(node.value)
-        elif isinstance(node, ast.List):
-            elements = [self._get_value(elt) for elt in node.elts]
-            return f"[{', '.join(elements)}]"
-        elif isinstance(node, ast.Dict):
-            keys = [self._get_value(key) for key in node.keys]
-            values = [self._get_value(value) for value in node.values]
-            items = [f"{k}: {v}" for k, v in zip(keys, values)]
-            return f"{{{', '.join(items)}}}"
-        elif isinstance(node, ast.Name):
-            return node.id
-        elif isinstance(node, ast.Call):
-            func_name = self._get_name(node.func)
-            args = [self._get_value(arg) for arg in node.args]
-            return f"{func_name}({', '.join(args)})"
-        else:
-            return "..."
+        return self._get_name(node)
@@ -7,9 +7,58 @@ This module provides functionality to parse Unity shader files.
 """
 
 import re
-from typing import Dict, List, Any, Optional
+import sys
+from typing import Dict, Iterator, List, Any, Optional
 from .base_parser import BaseParser
 
+# Regex patterns for shader parsing, compiled once for all files
+_SHADER_NAME_RE = re.compile(r"Shader\s+\"([^\"]+)\"")
+# Block openers, the block bodies are found by matching their braces
+_PROPERTIES_BLOCK_RE = re.compile(r"\bProperties\s*\{")
+_SUBSHADER_RE = re.compile(r"\bSubShader\s*\{")
+_PASS_RE = re.compile(r"\bPass\s*\{")
+_BRACE_RE = re.compile(r"[{}]")
+# The default value runs to the end of its line
+_PROPERTY_RE = re.compile(r'_(\w+)\s*\(\s*"([^"]*)"\s*,\s*(\w+)\s*\)\s*=\s*([^\r\n]*)')
+# CG and HLSL programs in one scan, the group that matched tells them apart
+_PROGRAM_RE = re.compile(r"CGPROGRAM(.*?)ENDCG|HLSLPROGRAM(.*?)ENDHLSL", re.DOTALL)
+_TAG_BLOCK_RE = re.compile(r"Tags\s*{([^}]*)}", re.DOTALL)
+_TAG_RE = re.compile(r"\"(\w+)\"\s*=\s*\"([^\"]*)\"")
+_PASS_NAME_RE = re.compile(r"Name\s+\"([^\"]*)\"")
+_PRAGMA_RE = re.compile(r"#pragma\s+(vertex|fragment)\s+(\w+)")
+
+
+def _iter_blocks(opener_re: re.Pattern, content: str) -> Iterator[str]:
+    """
+    Iterate over the bodies of the blocks opened by a pattern.
+    
+    Each body runs to the brace matching the one that ends the opener,
+    so nested blocks such as texture defaults or program code are kept.
+    The search resumes after the end of each block.
+    
+    Args:
+        opener_re: Pattern matching a block keyword and its opening brace.
+        content: The content to search.
+        
+    Returns:
+        Iterator[str]: The block bodies, without their braces.
+    """
+    pos = 0
+    while (opener := opener_re.search(content, pos)) is not None:
+        body_start = opener.end()
+        body_end = pos = len(content)
+        brace_count = 1
+        for brace in _BRACE_RE.finditer(content, body_start):
+            if brace.group() == '{':
+                brace_count += 1
+            else:
+                brace_count -= 1
+                if brace_count == 0:
+                    body_end = brace.start()
+                    pos = brace.end()
+                    break
+        yield content[body_start:body_end]
+
 
 class ShaderParser(BaseParser):
     """
@@ -17,6 +66,8 @@ class ShaderParser(BaseParser):
     Extracts shader properties, passes, and subshaders.
     """
 
+    __slots__ = ('_subshaders',)
+
     def __init__(self, file_path: str):
         """
         Initialize the shader parser with a file path.
@@ -25,14 +76,12 @@ class ShaderParser(BaseParser):
             file_path: Path to the shader file to parse.
         """
         super().__init__(file_path)
-        # Regex patterns for shader parsing
-        self.shader_name_pattern = r"Shader\s+\"([^\"]+)\""
-        self.properties_block_pattern = r"Properties\s*{([^}]*)}"
-        self.property_pattern = r"_(\w+)\s*\(\s*\"([^\"]*)\"\s*,\s*(\w+)\s*\)\s*=\s*([^\\n]*)"
-        self.subshader_pattern = r"SubShader\s*{([^}]*)}"
-        self.pass_pattern = r"Pass\s*{([^}]*)}"
-        self.cg_program_pattern = r"CGPROGRAM(.*?)ENDCG"
-        self.hlsl_program_pattern = r"HLSLPROGRAM(.*?)ENDHLSL"
+
+    def _reset_state(self) -> None:
+        """
+        Discard the results cached for the previous content.
+        """
+        self._subshaders = None
 
     def parse(self) -> Dict[str, Any]:
         """
@@ -56,7 +105,7 @@ class ShaderParser(BaseParser):
         Returns:
             str: The name of the shader.
         """
-        match = re.search(self.shader_name_pattern, self.content)
+        match = _SHADER_NAME_RE.search(self.content)
         return match.group(1) if match else "Unknown Shader"
 
     def get_properties(self) -> List[Dict[str, Any]]:
@@ -69,22 +118,15 @@ class ShaderParser(BaseParser):
         properties = []
         
         # Find the Properties block
-        properties_match = re.search(self.properties_block_pattern, self.content, re.DOTALL)
-        if properties_match:
-            properties_block = properties_match.group(1)
-            
+        properties_block = next(_iter_blocks(_PROPERTIES_BLOCK_RE, self.content), None)
+        if properties_block is not None:
             # Extract individual properties
-            for prop_match in re.finditer(self.property_pattern, properties_block):
-                prop_name = prop_match.group(1)
-                prop_display_name = prop_match.group(2)
-                prop_type = prop_match.group(3)
-                prop_default = prop_match.group(4).strip()
-                
+            for prop_name, prop_display_name, prop_type, prop_default in _PROPERTY_RE.findall(properties_block):
                 property_info = {
                     "name": f"_{prop_name}",
                     "display_name": prop_display_name,
-                    "type": prop_type,
-                    "default_value": prop_default
+                    "type": sys.intern(prop_type),
+                    "default_value": prop_default.strip()
                 }
                 
                 properties.append(property_info)
@@ -95,16 +137,29 @@ class ShaderParser(BaseParser):
         """
         Extract subshaders from the shader.
         
+        Returns:
+            List[Dict[str, Any]]: A list of dictionaries, each containing information about a subshader.
+        """
+        if self._subshaders is None:
+            self._subshaders = self._find_subshaders()
+        return self._subshaders
+
+    def _find_subshaders(self) -> List[Dict[str, Any]]:
+        """
+        Scan the content for subshaders.
+        
         Returns:
             List[Dict[str, Any]]: A list of dictionaries, each containing information about a subshader.
         """
         subshaders = []
         
-        for subshader_match in re.finditer(self.subshader_pattern, self.content, re.DOTALL):
-            subshader_content = subshader_match.group(1)
+        for subshader_content in _iter_blocks(_SUBSHADER_RE, self.content):
+            # Only the part before the first pass holds the subshader's own tags
+            first_pass = _PASS_RE.search(subshader_content)
+            header = subshader_content[:first_pass.start()] if first_pass else subshader_content
             
             subshader_info = {
-                "tags": self.extract_tags(subshader_content),
+                "tags": self.extract_tags(header),
                 "passes": self.extract_passes(subshader_content)
             }
             
@@ -126,6 +181,28 @@ class ShaderParser(BaseParser):
             
         return all_passes
 
+    def get_classes(self) -> List[Dict[str, Any]]:
+        """
+        Extract classes from the shader.
+        
+        Shaders have no classes, this only fulfils the BaseParser interface.
+        
+        Returns:
+            List[Dict[str, Any]]: An empty list.
+        """
+        return []
+
+    def get_methods(self) -> List[Dict[str, Any]]:
+        """
+        Extract methods from the shader.
+        
+        Shaders have no methods, this only fulfils the BaseParser interface.
+        
+        Returns:
+            List[Dict[str, Any]]: An empty list.
+        """
+        return []
+
     def extract_tags(self, content: str) -> Dict[str, str]:
         """
         Extract tags from a shader block.
@@ -137,17 +214,11 @@ class ShaderParser(BaseParser):
             Dict[str, str]: A dictionary of tag names and values.
         """
         tags = {}
-        tag_block_pattern = r"Tags\s*{([^}]*)}"
-        tag_pattern = r"\"(\w+)\"\s*=\s*\"([^\"]*)\""
-        
-        tag_block_match = re.search(tag_block_pattern, content, re.DOTALL)
+        tag_block_match = _TAG_BLOCK_RE.search(content)
         if tag_block_match:
             tag_block = tag_block_match.group(1)
             
-            for tag_match in re.finditer(tag_pattern, tag_block):
-                tag_name = tag_match.group(1)
-                tag_value = tag_match.group(2)
-                tags[tag_name] = tag_value
+            tags.update(_TAG_RE.findall(tag_block))
                 
         return tags
 
@@ -163,25 +234,25 @@ class ShaderParser(BaseParser):
         """
         passes = []
         
-        for pass_match in re.finditer(self.pass_pattern, content, re.DOTALL):
-            pass_content = pass_match.group(1)
-            
+        for pass_content in _iter_blocks(_PASS_RE, content):
             # Extract shader programs (CG or HLSL)
             cg_programs = []
-            for cg_match in re.finditer(self.cg_program_pattern, pass_content, re.DOTALL):
-                cg_programs.append(cg_match.group(1))
-                
             hlsl_programs = []
-            for hlsl_match in re.finditer(self.hlsl_program_pattern, pass_content, re.DOTALL):
-                hlsl_programs.append(hlsl_match.group(1))
+            for program_match in _PROGRAM_RE.finditer(pass_content):
+                if program_match.lastindex == 1:
+                    cg_programs.append(program_match.group(1))
+                else:
+                    hlsl_programs.append(program_match.group(2))
+                
+            entry_points = self._extract_entry_points(pass_content)
                 
             pass_info = {
                 "name": self.extract_pass_name(pass_content),
                 "tags": self.extract_tags(pass_content),
                 "cg_programs": cg_programs,
                 "hlsl_programs": hlsl_programs,
-                "vertex_program": self.extract_vertex_program(pass_content),
-                "fragment_program": self.extract_fragment_program(pass_content)
+                "vertex_program": entry_points.get("vertex", ""),
+                "fragment_program": entry_points.get("fragment", "")
             }
             
             passes.append(pass_info)
@@ -198,8 +269,7 @@ class ShaderParser(BaseParser):
         Returns:
             str: The name of the pass.
         """
-        name_pattern = r"Name\s+\"([^\"]*)\""
-        match = re.search(name_pattern, pass_content)
+        match = _PASS_NAME_RE.search(pass_content)
         return match.group(1) if match else "Unnamed Pass"
 
     def extract_vertex_program(self, pass_content: str) -> str:
@@ -212,10 +282,7 @@ class ShaderParser(BaseParser):
         Returns:
             str: The vertex program code.
         """
-        # This is a simplified version, actual implementation would be more complex
-        vertex_pattern = r"#pragma\s+vertex\s+(\w+)"
-        match = re.search(vertex_pattern, pass_content)
-        return match.group(1) if match else ""
+        return self._extract_entry_points(pass_content).get("vertex", "")
 
     def extract_fragment_program(self, pass_content: str) -> str:
         """
@@ -227,7 +294,19 @@ class ShaderParser(BaseParser):
         Returns:
             str: The fragment program code.
         """
-        # This is a simplified version, actual implementation would be more complex
-        fragment_pattern = r"#pragma\s+fragment\s+(\w+)"
-        match = re.search(fragment_pattern, pass_content)
-        return match.group(1) if match else ""
+        return self._extract_entry_points(pass_content).get("fragment", "")
+
+    def _extract_entry_points(self, pass_content: str) -> Dict[str, str]:
+        """
+        Extract the vertex and fragment entry points of a pass in one scan.
+        
+        Args:
+            pass_content: The content of the pass.
+            
+        Returns:
+            Dict[str, str]: The first entry point declared for each stage.
+        """
+        entry_points = {}
+        for stage, entry_point in _PRAGMA_RE.findall(pass_content):
+            entry_points.setdefault(stage, entry_point)
+        return entry_points
@@ -0,0 +1,85 @@
+"""JSON serialization for CodeDoc MCP Server.
+
+Tool results are nested dicts that can get large for whole directories,
+so they are encoded with orjson when it is installed (the "fast" extra),
+falling back to the standard json module otherwise.
+
+Dict tool results are sent as compact JSON with non-ASCII characters
+unescaped, where FastMCP's own conversion separates items with spaces
+and escapes them. Both are equivalent JSON documents.
+"""
+
+# Import built-in modules
+import json
+from typing import Any, Sequence
+
+# Import third-party modules
+import pydantic_core
+from loguru import logger
+from mcp.server.fastmcp import server as fastmcp_server
+from mcp.types import TextContent
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize an object to a JSON string.
+
+    Values the encoder does not handle natively are converted the same
+    way FastMCP converts tool results.
+
+    Args:
+        obj: Object to serialize.
+
+    Returns:
+        str: JSON representation of the object.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            default=pydantic_core.to_jsonable_python,
+            option=orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+    return json.dumps(
+        pydantic_core.to_jsonable_python(obj),
+        separators=(",", ":"),
+        ensure_ascii=False
+    )
+
+
+# FastMCP's private result conversion, checked against the pinned mcp versions
+_convert_to_content = getattr(fastmcp_server, "_convert_to_content", None)
+
+
+def _convert_dict_to_content(result: Any) -> Sequence[Any]:
+    """
+    Convert a tool result to MCP content, encoding dicts with dumps.
+
+    Args:
+        result: Value returned by a tool.
+
+    Returns:
+        Sequence[Any]: Content objects for the result.
+    """
+    if isinstance(result, dict):
+        return [TextContent(type="text", text=dumps(result))]
+    return _convert_to_content(result)
+
+
+def install_fast_json() -> None:
+    """
+    Make FastMCP serialize dict tool results with dumps.
+
+    FastMCP has no serializer hook, so its result conversion function is
+    wrapped instead. Other result types keep the default handling. If the
+    installed mcp release no longer has that function, FastMCP's own
+    serialization is left in place.
+    """
+    if not callable(_convert_to_content):
+        logger.debug("FastMCP result conversion not found, keeping its default serialization")
+        return
+    fastmcp_server._convert_to_content = _convert_dict_to_content
@@ -17,6 +17,9 @@ from codedoc_mcp.app import APP_NAME
 from codedoc_mcp.app import mcp
 from codedoc_mcp.log_config import setup_logging
 
+# Register the tools, the package no longer imports them eagerly
+import codedoc_mcp.file  # noqa: F401
+
 # Re-export tools for easier imports
 
 
@@ -0,0 +1,25 @@
+"""Shared fixtures for the CodeDoc tests."""
+
+# Import built-in modules
+import sys
+
+# Import third-party modules
+import pytest
+from loguru import logger
+
+# Import local modules
+from codedoc_mcp import cache
+from codedoc_mcp import file
+
+# Log to the real stderr, pytest closes its captured stream before the cache stats are reported at exit
+logger.remove()
+logger.add(sys.__stderr__, level="WARNING")
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Keep the on-disk parse cache and in-memory memos out of the user's cache directory."""
+    monkeypatch.setattr(cache, "AST_CACHE_DIR", tmp_path / "ast-cache")
+    monkeypatch.setattr(cache, "_source_keys", cache.MTimeLRU(cache.SOURCE_CACHE_SIZE))
+    monkeypatch.setattr(file, "_recent_parses", cache.MTimeLRU(file.RECENT_PARSES_SIZE))
+    return tmp_path / "ast-cache"
@@ -0,0 +1,100 @@
+"""Tests for the shared parser behaviour."""
+
+# Import local modules
+from codedoc_mcp.parser.csharp_parser import CSharpParser
+from codedoc_mcp.parser.cpp_parser import CppParser
+
+
+def _parser(parser_class, text):
+    parser = parser_class("in-memory")
+    parser.content = text
+    return parser
+
+
+def test_code_blanks_line_and_block_comments():
+    parser = _parser(CppParser, "int a; // note\nint b; /* block\nspanning */ int c;\n")
+
+    assert parser.code == "int a;  \nint b;   int c;\n"
+
+
+def test_code_keeps_comment_markers_inside_strings():
+    text = 'const char* url = "http://example.com/*x*/"; // trailing\nchar c = \'/\';\n'
+    parser = _parser(CppParser, text)
+
+    assert parser.code == 'const char* url = "http://example.com/*x*/";  \nchar c = \'/\';\n'
+
+
+def test_code_keeps_escaped_quotes_in_strings():
+    parser = _parser(CppParser, 'auto s = "say \\"//hi\\""; /* gone */\n')
+
+    assert parser.code == 'auto s = "say \\"//hi\\"";  \n'
+
+
+def test_code_keeps_csharp_verbatim_strings():
+    text = 'var path = @"C:\\temp\\"" // not a comment"; // comment\n'
+    parser = _parser(CSharpParser, text)
+
+    assert parser.code == 'var path = @"C:\\temp\\"" // not a comment";  \n'
+
+
+def test_code_blanks_unterminated_block_comment():
+    parser = _parser(CppParser, "int a; /* never closed\nint b;\n")
+
+    assert parser.code == "int a;  "
+
+
+def test_commented_out_declarations_are_ignored():
+    parser = _parser(CSharpParser, "// public class Ghost { }\npublic class Real\n{\n}\n")
+
+    assert [c["name"] for c in parser.get_classes()] == ["Real"]
+
+
+def test_assigning_content_discards_previous_results():
+    parser = _parser(CSharpParser, "public class First\n{\n}\n")
+    assert [c["name"] for c in parser.get_classes()] == ["First"]
+
+    parser.content = "public class Second\n{\n}\n"
+
+    assert [c["name"] for c in parser.get_classes()] == ["Second"]
+    assert parser.content_bytes == b"public class Second\n{\n}\n"
+
+
+def test_code_keeps_cpp_raw_strings():
+    text = (
+        'auto a = R"x(say "/*" here)x"; // gone\n'
+        'auto b = u8R"(line one\n// still text\n)";\n'
+    )
+    parser = _parser(CppParser, text)
+
+    assert parser.code == (
+        'auto a = R"x(say "/*" here)x";  \n'
+        'auto b = u8R"(line one\n// still text\n)";\n'
+    )
+
+
+def test_raw_string_does_not_hide_cpp_class():
+    text = 'const char* kOpen = R"(")/*)";\nclass Real\n{\npublic:\n    int id() const { return 1; }\n};\n'
+    parser = _parser(CppParser, text)
+
+    assert [c["name"] for c in parser.get_classes()] == ["Real"]
+
+
+def test_code_keeps_csharp_interpolated_verbatim_and_raw_strings():
+    text = (
+        'var a = $@"{dir}\\"" // text"; // gone\n'
+        'var b = @$"C:\\ // text"; /* gone */\n'
+        'var c = """\n    say "hi" // text\n    """; // gone\n'
+    )
+    parser = _parser(CSharpParser, text)
+
+    assert parser.code == (
+        'var a = $@"{dir}\\"" // text";  \n'
+        'var b = @$"C:\\ // text";  \n'
+        'var c = """\n    say "hi" // text\n    """;  \n'
+    )
+
+
+def test_verbatim_string_does_not_hide_csharp_class():
+    parser = _parser(CSharpParser, 'var p = @$"C:\\" + "/*";\npublic class Real\n{\n}\n')
+
+    assert [c["name"] for c in parser.get_classes()] == ["Real"]
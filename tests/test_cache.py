@@ -0,0 +1,215 @@
+"""Tests for the parse and output caches."""
+
+# Import built-in modules
+import os
+import threading
+import time
+
+# Import local modules
+from codedoc_mcp import cache
+from codedoc_mcp import file
+from codedoc_mcp.generator import markdown_generator
+from codedoc_mcp.generator import mermaid_generator
+from codedoc_mcp.generator.writer import write_file
+
+
+def _touch(path, mtime_ns):
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_mtime_lru_invalidates_on_mtime_change():
+    lru = cache.MTimeLRU(maxsize=2)
+    lru.put("a.py", 1, "parsed")
+
+    assert lru.get("a.py", 1) == "parsed"
+    assert lru.get("a.py", 2) is None
+
+
+def test_mtime_lru_evicts_least_recently_used():
+    lru = cache.MTimeLRU(maxsize=2)
+    lru.put("a.py", 1, "a")
+    lru.put("b.py", 1, "b")
+    lru.get("a.py", 1)
+    lru.put("c.py", 1, "c")
+
+    assert lru.get("a.py", 1) == "a"
+    assert lru.get("b.py", 1) is None
+    assert lru.get("c.py", 1) == "c"
+
+
+def test_parsed_data_miss_then_hit(tmp_path):
+    source = tmp_path / "sample.py"
+    source.write_text("x = 1\n")
+    key = cache.get_cache_key(str(source), "PythonParser")
+    hits, misses = cache._stats["hits"], cache._stats["misses"]
+
+    assert cache.load_parsed_data(key) is None
+    cache.store_parsed_data(key, {"language": "Python", "globals": [{"name": "x", "value": "1"}]})
+    assert cache.load_parsed_data(key) == {"language": "Python", "globals": [{"name": "x", "value": "1"}]}
+    assert cache._stats["hits"] == hits + 1
+    assert cache._stats["misses"] == misses + 1
+
+
+def test_cache_key_changes_with_content_and_mtime(tmp_path):
+    source = tmp_path / "sample.py"
+    source.write_text("x = 1\n")
+    _touch(source, 1_000_000_000)
+    key = cache.get_cache_key(str(source), "PythonParser")
+
+    assert cache.get_cache_key(str(source), "PythonParser") == key
+    assert cache.get_cache_key(str(source), "CppParser") != key
+
+    source.write_text("x = 2\n")
+    _touch(source, 2_000_000_000)
+    assert cache.get_cache_key(str(source), "PythonParser") != key
+
+
+def test_parse_file_reparses_after_mtime_change(tmp_path):
+    source = tmp_path / "sample.py"
+    source.write_text("x = 1\n")
+    _touch(source, 1_000_000_000)
+
+    first = file.parse_file(str(source))
+    assert file.parse_file(str(source)) is first
+
+    source.write_text("y = 2\n")
+    _touch(source, 2_000_000_000)
+    second = file.parse_file(str(source))
+
+    assert [g["name"] for g in first["globals"]] == ["x"]
+    assert [g["name"] for g in second["globals"]] == ["y"]
+
+
+def test_generated_files_record_is_per_source_path(tmp_path):
+    output_dir = tmp_path / "docs"
+    generated = output_dir / "m_documentation.md"
+    output_dir.mkdir()
+    generated.write_text("# m.py\n")
+    files = [{"type": "markdown", "path": str(generated)}]
+
+    cache.store_generated_files(str(output_dir), str(tmp_path / "a" / "m.py"), "key-a", files)
+
+    assert cache.load_generated_files(str(output_dir), str(tmp_path / "a" / "m.py"), "key-a") == files
+    assert cache.load_generated_files(str(output_dir), str(tmp_path / "a" / "m.py"), "key-b") is None
+    assert cache.load_generated_files(str(output_dir), str(tmp_path / "b" / "m.py"), "key-a") is None
+
+
+def test_generated_files_record_invalidated_when_output_changes(tmp_path):
+    output_dir = tmp_path / "docs"
+    generated = output_dir / "m_documentation.md"
+    output_dir.mkdir()
+    generated.write_text("# m.py\n")
+    _touch(generated, 1_000_000_000)
+    files = [{"type": "markdown", "path": str(generated)}]
+    cache.store_generated_files(str(output_dir), str(tmp_path / "m.py"), "key", files)
+
+    # Another source with the same file name overwrote the output
+    _touch(generated, 2_000_000_000)
+    assert cache.load_generated_files(str(output_dir), str(tmp_path / "m.py"), "key") is None
+
+    generated.unlink()
+    assert cache.load_generated_files(str(output_dir), str(tmp_path / "m.py"), "key") is None
+
+
+def test_cache_key_changes_with_parser_code(tmp_path, monkeypatch):
+    source = tmp_path / "sample.py"
+    source.write_text("x = 1\n")
+    parsers = tmp_path / "parser"
+    parsers.mkdir()
+    (parsers / "python_parser.py").write_text("VERSION = 1\n")
+    monkeypatch.setattr(cache, "_PARSER_DIR", parsers)
+    key = cache.get_cache_key(str(source), "PythonParser")
+
+    # A new process sees the edited parser, the in-memory key memo starts empty
+    edited = tmp_path / "edited-parser"
+    edited.mkdir()
+    (edited / "python_parser.py").write_text("VERSION = 2\n")
+    monkeypatch.setattr(cache, "_PARSER_DIR", edited)
+    monkeypatch.setattr(cache, "_source_keys", cache.MTimeLRU(cache.SOURCE_CACHE_SIZE))
+
+    assert cache.get_cache_key(str(source), "PythonParser") != key
+
+
+
+class _SlowParser:
+    """Parser wrapper that blocks until released, recording each parse."""
+
+    def __init__(self, parser, parses, started, release):
+        self._parser = parser
+        self._parses = parses
+        self._started = started
+        self._release = release
+
+    def parse(self):
+        self._parses.append(self._parser.file_path)
+        self._started.set()
+        self._release.wait(5)
+        return self._parser.parse()
+
+
+def test_concurrent_parse_file_calls_share_one_parse(tmp_path, monkeypatch):
+    source = tmp_path / "sample.py"
+    source.write_text("x = 1\n")
+    get_parser = file._get_parser
+    started = threading.Event()
+    release = threading.Event()
+    parses = []
+    monkeypatch.setattr(
+        file,
+        "_get_parser",
+        lambda *args: _SlowParser(get_parser(*args), parses, started, release)
+    )
+    results = []
+
+    def run():
+        results.append(file.parse_file(str(source)))
+
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    threads[0].start()
+    assert started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    # Give the followers time to find the leader's parse in flight
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert parses == [str(source)]
+    assert len(results) == 4
+    assert all(result is results[0] for result in results)
+    assert [g["name"] for g in results[0]["globals"]] == ["x"]
+    assert file._INFLIGHT == {}
+
+
+
+def test_generate_documentation_skips_unchanged_outputs(tmp_path, monkeypatch):
+    source = tmp_path / "sample.py"
+    source.write_text("class First:\n    pass\n")
+    _touch(source, 1_000_000_000)
+    output_dir = str(tmp_path / "docs")
+    written = []
+
+    def recording_write_file(file_path, content):
+        written.append(file_path)
+        write_file(file_path, content)
+
+    monkeypatch.setattr(markdown_generator, "write_file", recording_write_file)
+    monkeypatch.setattr(mermaid_generator, "write_file", recording_write_file)
+
+    generated = file.analyze_file(str(source), output_dir=output_dir)["generated_files"]
+    paths = [g["path"] for g in generated]
+    assert sorted(written) == sorted(paths)
+
+    written.clear()
+    assert file.analyze_file(str(source), output_dir=output_dir)["generated_files"] == generated
+    assert written == []
+
+    source.write_text("class Second:\n    pass\n")
+    _touch(source, 2_000_000_000)
+    assert file.analyze_file(str(source), output_dir=output_dir)["generated_files"] == generated
+    assert sorted(written) == sorted(paths)
+    with open(paths[0], encoding="utf-8") as markdown:
+        text = markdown.read()
+    assert "Second" in text
+    assert "First" not in text
@@ -0,0 +1,199 @@
+"""Tests for directory scanning and the analysis tools."""
+
+# Import built-in modules
+import asyncio
+import json
+import os
+
+# Import local modules
+from codedoc_mcp import file
+
+
+def _write(path, text="x = 1\n"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return str(path)
+
+
+def test_iter_code_files_yields_files_before_subdirectories(tmp_path):
+    top = _write(tmp_path / "top.py")
+    nested = _write(tmp_path / "pkg" / "inner" / "nested.py")
+    sibling = _write(tmp_path / "pkg" / "sibling.py")
+    _write(tmp_path / "notes.txt")
+
+    found = list(file._iter_code_files(str(tmp_path), (".py",)))
+
+    assert found[0] == top
+    assert found.index(sibling) < found.index(nested)
+    assert sorted(found) == sorted([top, nested, sibling])
+
+
+def test_iter_code_files_matches_extensions_case_insensitively(tmp_path):
+    upper = _write(tmp_path / "Player.CS", "class Player {}\n")
+    _write(tmp_path / "readme.md")
+
+    assert list(file._iter_code_files(str(tmp_path), (".cs",))) == [upper]
+
+
+def test_iter_code_files_not_recursive(tmp_path):
+    top = _write(tmp_path / "top.py")
+    _write(tmp_path / "pkg" / "nested.py")
+
+    assert list(file._iter_code_files(str(tmp_path), (".py",), recursive=False)) == [top]
+
+
+def test_iter_code_files_skips_unreadable_subdirectory(tmp_path, monkeypatch):
+    top = _write(tmp_path / "top.py")
+    _write(tmp_path / "locked" / "hidden.py")
+    readable = _write(tmp_path / "open" / "visible.py")
+    scandir = os.scandir
+
+    def guarded_scandir(path):
+        if os.path.basename(path) == "locked":
+            raise PermissionError(13, "Permission denied", path)
+        return scandir(path)
+
+    monkeypatch.setattr(file.os, "scandir", guarded_scandir)
+
+    assert sorted(file._iter_code_files(str(tmp_path), (".py",))) == sorted([top, readable])
+
+
+def test_iter_code_files_skips_missing_directory(tmp_path):
+    assert list(file._iter_code_files(str(tmp_path / "missing"), (".py",))) == []
+
+
+def test_iter_code_files_skips_files_over_size_limit(tmp_path, monkeypatch):
+    small = _write(tmp_path / "small.py", "x = 1\n")
+    large = _write(tmp_path / "large.py", "x = 1\n" * 100)
+    monkeypatch.setattr(file, "MAX_FILE_BYTES", 64)
+    skipped = []
+
+    assert list(file._iter_code_files(str(tmp_path), (".py",), skipped=skipped)) == [small]
+    assert skipped == [large]
+
+
+def test_analyze_directory_reports_skipped_files(tmp_path, monkeypatch):
+    small = _write(tmp_path / "src" / "small.py", "x = 1\n")
+    large = _write(tmp_path / "src" / "large.py", "x = 1\n" * 100)
+    monkeypatch.setattr(file, "MAX_FILE_BYTES", 64)
+
+    result = asyncio.run(file.analyze_directory(str(tmp_path / "src"), output_dir=str(tmp_path / "docs")))
+
+    assert [a["file_path"] for a in result["analyzed_files"]] == [small]
+    assert result["skipped_files"] == [large]
+
+
+def test_analyze_code_files_result_shape(tmp_path):
+    good = _write(tmp_path / "good.py", "class Good:\n    def run(self):\n        pass\n")
+    missing = str(tmp_path / "missing.py")
+    output_dir = str(tmp_path / "docs")
+
+    result = asyncio.run(file.analyze_code_files([good, missing], output_dir=output_dir))
+
+    assert set(result) == {"results", "errors"}
+    assert list(result["results"]) == [good]
+    assert list(result["errors"]) == [missing]
+    assert isinstance(result["errors"][missing], str)
+
+    outcome = result["results"][good]
+    assert outcome["file_path"] == good
+    assert outcome["parsed_data"]["language"] == "Python"
+    assert [c["name"] for c in outcome["parsed_data"]["classes"]] == ["Good"]
+    assert {g["type"] for g in outcome["generated_files"]} == {"markdown", "class_diagram"}
+    assert all(os.path.exists(g["path"]) for g in outcome["generated_files"])
+
+
+def test_analyze_directory_names_colliding_files_by_path(tmp_path):
+    _write(tmp_path / "src" / "alpha" / "__init__.py", "class Alpha:\n    pass\n")
+    _write(tmp_path / "src" / "beta" / "__init__.py", "class Beta:\n    pass\n")
+    _write(tmp_path / "src" / "gamma.py", "class Gamma:\n    pass\n")
+    docs = tmp_path / "docs"
+
+    asyncio.run(file.analyze_directory(str(tmp_path / "src"), output_dir=str(docs), generate_class_diagram=False))
+
+    assert sorted(p.name for p in docs.glob("*.md")) == [
+        "alpha.__init__.py_documentation.md",
+        "beta.__init__.py_documentation.md",
+        "gamma_documentation.md",
+    ]
+    assert "Alpha" in (docs / "alpha.__init__.py_documentation.md").read_text()
+    assert "Beta" in (docs / "beta.__init__.py_documentation.md").read_text()
+
+
+def test_pool_context_does_not_fork():
+    assert file._POOL_CONTEXT.get_start_method() in ("forkserver", "spawn")
+
+
+def test_analyze_directory_in_worker_processes(tmp_path, monkeypatch):
+    # Worker processes do not see the isolated cache fixture, keep their parse cache in tmp_path too
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg-cache"))
+    names = ["Alpha", "Beta", "Gamma", "Delta", "Epsilon"]
+    for name in names:
+        _write(tmp_path / "src" / f"{name.lower()}.py", f"class {name}:\n    def run(self):\n        pass\n")
+    monkeypatch.setattr(file, "PARALLEL_MIN_FILES", 2)
+    docs = tmp_path / "docs"
+
+    result = asyncio.run(file.analyze_directory(str(tmp_path / "src"), output_dir=str(docs), max_workers=2))
+
+    # Results are collected in directory order whatever order the workers finish in
+    order = list(file._iter_code_files(str(tmp_path / "src"), (".py",)))
+    assert [a["file_path"] for a in result["analyzed_files"]] == order
+    assert {a["status"] for a in result["analyzed_files"]} == {"success"}
+    assert len(result["generated_files"]) == 2 * len(names)
+    for name in names:
+        assert f"class {name}" in (docs / f"{name.lower()}_class_diagram.md").read_text()
+        assert name in (docs / f"{name.lower()}_documentation.md").read_text()
+
+
+class _RecordingContext:
+    """Stand-in for the MCP context that records the messages sent to the client."""
+
+    def __init__(self):
+        self.messages = []
+
+    async def info(self, message):
+        self.messages.append(message)
+
+    async def debug(self, message):
+        pass
+
+    async def error(self, message):
+        self.messages.append(message)
+
+    async def report_progress(self, progress):
+        pass
+
+
+def test_analyze_directory_streams_results_in_chunks(tmp_path, monkeypatch):
+    sources = [_write(tmp_path / "src" / f"m{i}.py", f"class M{i}:\n    pass\n") for i in range(3)]
+    broken = _write(tmp_path / "src" / "broken.py", "class Broken:\n    pass\n")
+    monkeypatch.setattr(file, "STREAM_CHUNK_SIZE", 2)
+    parse_file = file.parse_file
+
+    def failing_parse_file(file_path):
+        if file_path == broken:
+            raise ValueError("cannot parse")
+        return parse_file(file_path)
+
+    monkeypatch.setattr(file, "parse_file", failing_parse_file)
+    ctx = _RecordingContext()
+
+    result = asyncio.run(
+        file.analyze_directory(
+            str(tmp_path / "src"), output_dir=str(tmp_path / "docs"), stream_results=True, ctx=ctx
+        )
+    )
+
+    assert result == {
+        "directory_path": str(tmp_path / "src"),
+        "total_files": 4,
+        "failed_files": 1,
+        "skipped_files": [],
+    }
+    chunks = [json.loads(m)["results"] for m in ctx.messages if m.startswith('{"results"')]
+    assert [len(chunk) for chunk in chunks] == [2, 2]
+    outcomes = {outcome["file_path"]: outcome for chunk in chunks for outcome in chunk}
+    assert set(outcomes) == set(sources) | {broken}
+    assert outcomes[broken] == {"file_path": broken, "status": "error", "error": "cannot parse"}
+    for source in sources:
+        assert {g["type"] for g in outcomes[source]["generated_files"]} == {"markdown", "class_diagram"}
@@ -0,0 +1,38 @@
+"""Tests for the JavaScript parser."""
+
+# Import local modules
+from codedoc_mcp.parser.javascript_parser import JavaScriptParser
+
+
+def _parser(text):
+    parser = JavaScriptParser("in-memory.js")
+    parser.content = text
+    return parser
+
+
+def test_control_flow_in_method_bodies_is_not_a_method():
+    text = (
+        "class Queue extends Base {\n"
+        "  constructor(size) {\n"
+        "    this.size = size;\n"
+        "  }\n"
+        "  async push(item) {\n"
+        "    if (item) {\n"
+        "      for (const x of item) {\n"
+        "        while (x) { switch (x) { default: break; } }\n"
+        "      }\n"
+        "    }\n"
+        "  }\n"
+        "  store(item) {\n"
+        "    try { save(item); } catch (e) { log(e); }\n"
+        "  }\n"
+        "}\n"
+    )
+    parser = _parser(text)
+
+    queue = parser.get_classes()[0]
+    assert queue["name"] == "Queue"
+    assert queue["parent"] == "Base"
+    assert [(m["name"], [p["name"] for p in m["parameters"]]) for m in queue["methods"]] == [
+        ("constructor", ["size"]), ("push", ["item"]), ("store", ["item"])
+    ]
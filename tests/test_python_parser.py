@@ -0,0 +1,89 @@
+"""Tests for the Python parser."""
+
+# Import built-in modules
+import ast
+
+# Import local modules
+from codedoc_mcp.parser.python_parser import PythonParser
+
+
+def _parser(text):
+    parser = PythonParser("in-memory.py")
+    parser.content = text
+    return parser
+
+
+def test_classes_and_imports_found_in_nested_blocks_in_walk_order():
+    text = (
+        "import os\n"
+        "class Outer:\n"
+        "    class Inner:\n"
+        "        import json\n"
+        "try:\n"
+        "    from typing import Any\n"
+        "except ImportError:\n"
+        "    class Fallback:\n"
+        "        pass\n"
+        "finally:\n"
+        "    pass\n"
+        "def factory():\n"
+        "    if True:\n"
+        "        class Local:\n"
+        "            pass\n"
+        "    else:\n"
+        "        import re as regex\n"
+        "values = [lambda: None for _ in range(2)]\n"
+    )
+    parser = _parser(text)
+    walked = list(ast.walk(ast.parse(text)))
+
+    assert [c["name"] for c in parser.get_classes()] == [
+        node.name for node in walked if isinstance(node, ast.ClassDef)
+    ]
+    assert [c["name"] for c in parser.get_classes()] == ["Outer", "Inner", "Fallback", "Local"]
+    assert [(i["name"], i["alias"]) for i in parser.get_imports()] == [
+        ("os", None), ("Any", None), ("json", None), ("re", "regex")
+    ]
+
+
+def test_module_functions_listed_when_a_method_has_the_same_name():
+    text = (
+        "def run():\n"
+        "    pass\n"
+        "class Task:\n"
+        "    def run(self):\n"
+        "        pass\n"
+        "    def stop(self):\n"
+        "        pass\n"
+        "def helper():\n"
+        "    def inner():\n"
+        "        pass\n"
+    )
+    parser = _parser(text)
+
+    assert [f["name"] for f in parser.get_functions()] == ["run", "helper"]
+    assert [m["name"] for m in parser.get_methods()] == ["run", "stop"]
+
+
+def test_annotations_and_values_rendered_as_source():
+    text = (
+        "from typing import Dict, Optional\n"
+        "LIMITS = {'low': 1, 'high': -2}\n"
+        "class Store:\n"
+        "    DEFAULT = os.path.join('a', 'b')\n"
+        "    def get(self, key: Optional[str], table: Dict[str, int], mode: 'str | None' = None) -> typing.List[int]:\n"
+        "        pass\n"
+    )
+    parser = _parser(text)
+
+    assert parser.get_globals() == [{"name": "LIMITS", "value": "{'low': 1, 'high': -2}"}]
+    store = parser.get_classes()[0]
+    assert store["attributes"] == [{"name": "DEFAULT", "value": "os.path.join('a', 'b')"}]
+    method = store["methods"][0]
+    assert method["params"] == [
+        {"name": "self", "type": "Any"},
+        {"name": "key", "type": "Optional[str]"},
+        {"name": "table", "type": "Dict[str, int]"},
+        {"name": "mode", "type": "'str | None'"},
+    ]
+    assert method["return_type"] == "typing.List[int]"
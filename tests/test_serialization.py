@@ -0,0 +1,25 @@
+"""Tests for the JSON serialization of tool results."""
+
+# Import built-in modules
+import json
+from pathlib import Path
+
+# Import third-party modules
+import pytest
+
+# Import local modules
+from codedoc_mcp import serialization
+
+
+@pytest.mark.parametrize("encoder", ["orjson", "json"])
+def test_dumps_is_compact_and_keeps_non_ascii(encoder, monkeypatch):
+    if encoder == "json":
+        monkeypatch.setattr(serialization, "orjson", None)
+    elif serialization.orjson is None:
+        pytest.skip("orjson is not installed")
+    result = {"file": Path("src/café.py"), "classes": [{"name": "Größe"}]}
+
+    text = serialization.dumps(result)
+
+    assert text == '{"file":"src/café.py","classes":[{"name":"Größe"}]}'
+    assert json.loads(text) == {"file": "src/café.py", "classes": [{"name": "Größe"}]}
@@ -0,0 +1,64 @@
+"""Tests for the Unity shader parser."""
+
+# Import local modules
+from codedoc_mcp.parser.shader_parser import ShaderParser
+
+SHADER = """Shader "Custom/Nested" {
+    Properties {
+        _MainTex ("Texture", 2D) = "white" {}
+        _Color ("Tint", Color) = (1, 1, 1, 1)
+    }
+    SubShader {
+        Tags { "RenderType" = "Opaque" }
+        Pass {
+            Name "Forward"
+            Tags { "LightMode" = "ForwardBase" }
+            CGPROGRAM
+            #pragma vertex vert
+            #pragma fragment frag
+            struct v2f { float4 pos : SV_POSITION; };
+            v2f vert() { v2f o; return o; }
+            ENDCG
+        }
+        Pass {
+            Tags { "LightMode" = "ShadowCaster" }
+        }
+    }
+    SubShader {
+        Pass {
+            Tags { "LightMode" = "Always" }
+        }
+    }
+}
+"""
+
+
+def _parser(text):
+    parser = ShaderParser("in-memory.shader")
+    parser.content = text
+    return parser
+
+
+def test_blocks_keep_nested_braces():
+    parser = _parser(SHADER)
+
+    assert [(p["name"], p["type"], p["default_value"]) for p in parser.get_properties()] == [
+        ("_MainTex", "2D", '"white" {}'),
+        ("_Color", "Color", "(1, 1, 1, 1)"),
+    ]
+    assert [len(s["passes"]) for s in parser.get_subshaders()] == [2, 1]
+    forward = parser.get_passes()[0]
+    assert forward["name"] == "Forward"
+    assert (forward["vertex_program"], forward["fragment_program"]) == ("vert", "frag")
+    assert "v2f vert() { v2f o; return o; }" in forward["cg_programs"][0]
+
+
+def test_subshader_tags_come_only_from_its_header():
+    parser = _parser(SHADER)
+
+    assert [s["tags"] for s in parser.get_subshaders()] == [{"RenderType": "Opaque"}, {}]
+    assert [p["tags"] for p in parser.get_passes()] == [
+        {"LightMode": "ForwardBase"},
+        {"LightMode": "ShadowCaster"},
+        {"LightMode": "Always"},
+    ]